@@ -128,8 +128,10 @@ from .resolve_identifier import (
     is_valid_identifier,
     miriam_standardize_identifier,
     standardize_identifier,
+    standardize_identifiers,
 )
 from .resource_manager import Manager, manager
+from .resource_view import ResourceView
 from .schema import (
     Author,
     Collection,
@@ -173,6 +175,7 @@ __all__ = [
     "Provider",
     "Registry",
     "Resource",
+    "ResourceView",
     "StandardNamableReference",
     "StandardNamedReference",
     "StandardReference",
@@ -302,6 +305,7 @@ __all__ = [
     "registries",
     "resources",
     "standardize_identifier",
+    "standardize_identifiers",
     "write_collections",
     "write_contexts",
     "write_registry",
@@ -92,7 +92,7 @@ def _handle_formats(accept: str | None, fmt: str | None) -> str:
 @api_router.get("/registry", response_model=Mapping[str, Resource], tags=["resource"])
 def get_resources(
     manager: DependsManager, accept: Accept = None, format: Format = None
-) -> Response | dict[str, Resource]:
+) -> Response | Mapping[str, Resource]:
     """Get all resources."""
     return serialize_model_fastapi(manager, accept, format, manager.registry)
 
@@ -309,7 +309,7 @@ def get_metaresource_mappings(manager: DependsManager, metaprefix: Metaprefix) -
     """Get mappings from internal to external prefixes for a given external registry."""
     if metaprefix not in manager.metaregistry:
         raise HTTPException(404, detail=f"Invalid metaprefix: {metaprefix}")
-    return manager.get_registry_map(metaprefix)
+    return manager.get_mapping_index().get_map(metaprefix)
 
 
 @api_router.get("/collection", response_model=Mapping[str, Collection], tags=["collection"])
@@ -7,7 +7,13 @@ from pathlib import Path
 import click
 from more_click import host_option, port_option, verbose_option, with_gunicorn_option
 
-from bioregistry.constants import BIOREGISTRY_DEFAULT_BASE_URL
+from bioregistry.constants import (
+    BIOREGISTRY_DEFAULT_BASE_URL,
+    BIOREGISTRY_PATH,
+    COLLECTIONS_PATH,
+    CONTEXTS_PATH,
+    METAREGISTRY_PATH,
+)
 
 __all__ = [
     "web",
@@ -38,6 +44,18 @@ __all__ = [
     help="Base URL for app",
 )
 @click.option("--tab", is_flag=True, help="If passed, automatically opens a web browser")
+@click.option(
+    "--freeze",
+    is_flag=True,
+    help="If passed, serves from compact read-only views of resources to use less memory",
+)
+@click.option(
+    "--reload-interval",
+    type=float,
+    help="If given, checks the registry, metaregistry, collections, and contexts files "
+    "for changes every this many seconds and reloads them without a restart. Reloading "
+    "can also be triggered by sending SIGHUP to the process.",
+)
 def web(
     host: str,
     port: str,
@@ -51,26 +69,39 @@ def web(
     base_url: str | None,
     analytics: bool,
     tab: bool,
+    freeze: bool,
+    reload_interval: float | None,
 ) -> None:
     """Run the web application."""
     import uvicorn
 
-    from .impl import get_app
+    from .impl import get_app, set_manager
+    from .reload import ManagerReloader
     from ..resource_manager import Manager
 
     if with_gunicorn:
         click.secho("--with-gunicorn is deprecated", fg="yellow")
 
-    manager = Manager(
-        registry=registry,
-        metaregistry=metaregistry,
-        collections=collections,
-        contexts=contexts,
-        # is being able to load custom mismatches necessary?
-        base_url=base_url,
-    )
+    def _get_manager(
+        registry_path: Path | None,
+        metaregistry_path: Path | None,
+        collections_path: Path | None,
+        contexts_path: Path | None,
+    ) -> Manager:
+        manager = Manager(
+            registry=registry_path,
+            metaregistry=metaregistry_path,
+            collections=collections_path,
+            contexts=contexts_path,
+            # is being able to load custom mismatches necessary?
+            base_url=base_url,
+        )
+        if freeze:
+            manager = manager.freeze()
+        return manager
+
     app = get_app(
-        manager=manager,
+        manager=_get_manager(registry, metaregistry, collections, contexts),
         config=config,
         first_party=registry is None
         and metaregistry is None
@@ -79,6 +110,23 @@ def web(
         return_flask=False,
         analytics=analytics,
     )
+
+    # reloading needs to read the files again, even if they're the default ones
+    paths = (
+        registry or BIOREGISTRY_PATH,
+        metaregistry or METAREGISTRY_PATH,
+        collections or COLLECTIONS_PATH,
+        contexts or CONTEXTS_PATH,
+    )
+    reloader = ManagerReloader(
+        factory=lambda: _get_manager(*paths),
+        paths=paths,
+        callback=lambda manager: set_manager(app, manager),
+    )
+    reloader.install_signal_handler()
+    if reload_interval:
+        reloader.start(reload_interval)
+
     if tab:
         import webbrowser
 
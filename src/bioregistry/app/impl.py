@@ -16,6 +16,7 @@ from flask_bootstrap import Bootstrap4
 from markdown import markdown
 from rdflib_endpoint.sparql_router import SparqlRouter
 
+from . import proxies
 from .api import api_router
 from .constants import BIOSCHEMAS, KEY_A, KEY_B, KEY_C, KEY_D, KEY_E
 from .ui import ui_blueprint
@@ -43,6 +44,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "get_app",
+    "set_manager",
 ]
 
 
@@ -352,8 +354,9 @@ def get_app(
         },
     )
     fast_api.manager = manager  # type:ignore
+    fast_api.state.flask_app = app
     fast_api.include_router(api_router)
-    fast_api.include_router(_get_sparql_router(app, manager))
+    fast_api.include_router(_get_sparql_router(fast_api, app, manager))
     fast_api.mount("/", WSGIMiddleware(app))  # type:ignore
 
     if analytics and (analytics_api_key := conf.get("ANALYTICS_API_KEY")):
@@ -363,7 +366,7 @@ def get_app(
 
     # Make manager available in all jinja templates
     app.jinja_env.globals.update(
-        manager=manager,
+        manager=proxies.manager,
         curie_to_str=curie_to_str,
         fastapi_url_for=fast_api.url_path_for,
         markdown=markdown,
@@ -374,6 +377,20 @@ def get_app(
     return fast_api
 
 
+def set_manager(fast_api: FastAPI, manager: Manager) -> None:
+    """Swap the manager used by an app from :func:`get_app`, e.g., after reloading data.
+
+    :param fast_api: An app returned by :func:`get_app`
+    :param manager: The new manager. This should be fully built, including its
+        converter, since it's used by the next requests right away.
+
+    Requests that already started keep using the old manager until they're done.
+    """
+    fast_api.state.flask_app.manager = manager
+    fast_api.state.sparql_graph.converter = manager.converter
+    fast_api.manager = manager  # type:ignore
+
+
 def _prepare_config(
     config: str | Path | dict[str, Any] | None = None, first_party: bool = True
 ) -> dict[str, Any]:
@@ -446,8 +463,9 @@ SELECT ?s ?o WHERE {
 """.rstrip()
 
 
-def _get_sparql_router(app: Flask, manager: Manager) -> APIRouter:
+def _get_sparql_router(fast_api: FastAPI, app: Flask, manager: Manager) -> APIRouter:
     sparql_graph = MappingServiceGraph(converter=manager.converter)
+    fast_api.state.sparql_graph = sparql_graph
     sparql_processor: SPARQLProcessor = MappingServiceSPARQLProcessor(graph=sparql_graph)  # type:ignore [no-untyped-call]
     sparql_router: APIRouter = SparqlRouter(
         path="/sparql",
@@ -2,7 +2,7 @@
 
 from typing import cast
 
-from flask import current_app
+from flask import current_app, g
 from werkzeug.local import LocalProxy
 
 from ..resource_manager import Manager
@@ -11,4 +11,13 @@ __all__ = [
     "manager",
 ]
 
-manager: Manager = cast(Manager, LocalProxy(lambda: current_app.manager))
+
+def _get_manager() -> Manager:
+    # the app's manager can get swapped while reloading, so stick
+    # with the same one for the whole request
+    if "manager" not in g:
+        g.manager = current_app.manager  # type:ignore
+    return cast(Manager, g.manager)
+
+
+manager: Manager = cast(Manager, LocalProxy(_get_manager))
@@ -0,0 +1,133 @@
+"""Reloading the data behind a running web application."""
+
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from ..resource_manager import Manager
+
+__all__ = [
+    "ManagerReloader",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The modification time and size of each file, used to check if it changed
+Stamps = dict[Path, tuple[int, int] | None]
+
+
+class ManagerReloader:
+    """Rebuild a manager in the background when its data files change, then swap it in.
+
+    The new manager, including its converter and mapping index, is completely built
+    before it's handed to the callback, so requests never see a half-built manager. If
+    building fails, e.g., because a data file is being written or has a syntax error,
+    the old manager stays in use.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Manager],
+        paths: Iterable[str | Path],
+        callback: Callable[[Manager], None],
+    ) -> None:
+        """Initialize the reloader.
+
+        :param factory: A function that builds a new manager from the data files
+        :param paths: The data files to check for changes
+        :param callback: A function that swaps the new manager into the application,
+            e.g., :func:`bioregistry.app.impl.set_manager`
+        """
+        self.factory = factory
+        self.paths = [Path(path) for path in paths]
+        self.callback = callback
+        self._stamps = self._get_stamps()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _get_stamps(self) -> Stamps:
+        rv: Stamps = {}
+        for path in self.paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                rv[path] = None
+            else:
+                rv[path] = stat.st_mtime_ns, stat.st_size
+        return rv
+
+    def has_changed(self) -> bool:
+        """Check if any of the data files changed since the last (re)load."""
+        return self._get_stamps() != self._stamps
+
+    def reload(self) -> bool:
+        """Build a new manager and swap it in.
+
+        :returns: If the manager was swapped. This is false if building the manager
+            failed or if another reload was already running.
+        """
+        if not self._lock.acquire(blocking=False):
+            logger.info("skipping reload since another one is running")
+            return False
+        try:
+            # stamp before building, so changes made in the meantime trigger another reload
+            stamps = self._get_stamps()
+            try:
+                manager = self.factory()
+                # build the converter and indexes here so the first requests don't have to
+                _ = manager.converter
+                manager.get_mapping_index()
+            except Exception:
+                logger.exception("failed to reload, keeping the current manager")
+                return False
+            self._stamps = stamps
+            self.callback(manager)
+            logger.info("reloaded manager with %d resources", len(manager.registry))
+            return True
+        finally:
+            self._lock.release()
+
+    def reload_in_background(self) -> None:
+        """Reload in a background thread, e.g., from a signal handler."""
+        threading.Thread(target=self.reload, name="bioregistry-reload", daemon=True).start()
+
+    def start(self, interval: float) -> None:
+        """Start checking the data files for changes in a background thread.
+
+        :param interval: The number of seconds between checks
+        """
+        if self._thread is not None:
+            raise RuntimeError("reloader is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, args=(interval,), name="bioregistry-watch", daemon=True
+        )
+        self._thread.start()
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            if self.has_changed():
+                self.reload()
+
+    def stop(self) -> None:
+        """Stop checking the data files for changes."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def install_signal_handler(self) -> bool:
+        """Reload when the process gets a ``SIGHUP``, if the platform supports it.
+
+        :returns: If the handler was installed. This needs to be called from the main
+            thread.
+        """
+        if not hasattr(signal, "SIGHUP"):  # e.g., on Windows
+            return False
+        signal.signal(signal.SIGHUP, lambda _signum, _frame: self.reload_in_background())
+        return True
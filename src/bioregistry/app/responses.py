@@ -32,7 +32,7 @@ class YAMLResponse(Response):
                 exclude_none=True,
                 exclude_unset=True,
             )
-        elif isinstance(content, dict):
+        elif isinstance(content, Mapping):
             data = sanitize_mapping(content)
         else:
             raise TypeError
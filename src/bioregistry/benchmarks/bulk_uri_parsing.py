@@ -0,0 +1,49 @@
+"""A benchmark for Bioregistry's bulk URI parser."""
+
+import time
+from statistics import mean
+
+import click
+from tqdm import trange
+
+from bioregistry import manager
+from bioregistry.benchmarks.uri_parsing import get_uris
+
+
+@click.command()
+@click.option("--rebuild", is_flag=True)
+@click.option("--replicates", type=int, default=10)
+def main(rebuild: bool, replicates: int) -> None:
+    """Test parsing IRIs one at a time and in bulk."""
+    uris = [url for _, _, _, url in get_uris(rebuild=rebuild)]
+
+    # warm up the converter and the URI prefix index
+    manager.parse_uri("https://bioregistry.io/DRON:00023232")
+    manager.get_uri_index()
+
+    single_times, bulk_times = [], []
+    failures = 0
+    for _ in trange(replicates, desc="Test parsing URIs in bulk", unit="replicate"):
+        start = time.time()
+        expected = [manager.parse_uri(uri) for uri in uris]
+        single_times.append(time.time() - start)
+
+        start = time.time()
+        prefixes, identifiers = manager.parse_uris(uris)
+        bulk_times.append(time.time() - start)
+
+        failures += sum(
+            tuple(reference) != (prefix, identifier)
+            for reference, prefix, identifier in zip(expected, prefixes, identifiers, strict=True)
+        )
+
+    click.echo(
+        f"Bioregistry Bulk URI Parsing Benchmark ({len(uris):,} URIs)\n"
+        f"One at a time: {round(len(uris) / mean(single_times)):,} URI/s\n"
+        f"Bulk: {round(len(uris) / mean(bulk_times)):,} URI/s\n"
+        f"Errors: {failures // replicates}"
+    )
+
+
+if __name__ == "__main__":
+    main()
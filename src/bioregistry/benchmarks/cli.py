@@ -2,7 +2,7 @@
 
 import click
 
-from . import curie_parsing, curie_validation, uri_parsing
+from . import bulk_uri_parsing, curie_parsing, curie_validation, uri_parsing
 
 
 @click.command()
@@ -13,6 +13,7 @@ def main(ctx: click.Context, rebuild: bool, replicates: int) -> None:
     """Run all benchmarks."""
     ctx.invoke(curie_parsing.main, rebuild=rebuild, replicates=replicates)
     ctx.invoke(uri_parsing.main, rebuild=rebuild, replicates=replicates)
+    ctx.invoke(bulk_uri_parsing.main, rebuild=False, replicates=replicates)
     ctx.invoke(curie_validation.main, rebuild=rebuild, replicates=replicates)
 
 
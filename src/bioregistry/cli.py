@@ -6,8 +6,10 @@ import click
 
 from .app.cli import web
 from .compare import compare
+from .compress_rdf import compress_rdf_command
 from .export.cli import export
 from .lint import lint
+from .memory import memory
 from .schema import generate_schema
 from .utils import get_hexdigests, secho
 from .validate.cli import validate
@@ -105,6 +107,8 @@ main.add_command(export)
 main.add_command(validate)
 main.add_command(web)
 main.add_command(generate_schema)
+main.add_command(memory)
+main.add_command(compress_rdf_command)
 
 
 @main.command()
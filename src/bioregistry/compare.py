@@ -46,7 +46,6 @@ from .resolve import (
 )
 from .resource_manager import manager
 from .schema import Resource
-from .schema_utils import read_registry
 from .uri_format import get_uri_format
 
 if TYPE_CHECKING:
@@ -76,13 +75,13 @@ class RegistryInfo(typing.NamedTuple):
 def _get_has(func: Callable[[str], typing.Any], yes: str = "Yes", no: str = "No") -> Counter[str]:
     return Counter(
         no if func(prefix) is None else yes
-        for prefix in read_registry()
+        for prefix in manager.registry
         if not is_deprecated(prefix)
     )
 
 
 def _get_has_present(func: Callable[[str], X | None]) -> Counter[X]:
-    values = (func(prefix) for prefix in read_registry())
+    values = (func(prefix) for prefix in manager.registry)
     return Counter(value for value in values if value)
 
 
@@ -176,7 +175,7 @@ def _plot_attribute_pies(
         else:
             labels = ("Yes", "No")
             n_yes = counter.get("Yes", 0)
-            sizes = (n_yes, len(read_registry()) - n_yes)
+            sizes = (n_yes, len(manager.registry) - n_yes)
             explode = [0.1, 0]
         ax.pie(
             sizes,
@@ -214,7 +213,7 @@ def make_overlaps(keys: list[RegistryInfo]) -> OverlapsHint:
         #  vocabulary, when possible
         internal_remapped = {
             resource.get_external(metaprefix).get("prefix", prefix)
-            for prefix, resource in read_registry().items()
+            for prefix, resource in manager.registry.items()
         }
         rv[metaprefix] = {
             REMAPPED_KEY: internal_remapped,
@@ -401,7 +400,7 @@ def compare() -> None:
     ##################################################
     # Histogram of how many providers each entry has #
     ##################################################
-    provider_counts = [_count_providers(resource) for resource in read_registry().values()]
+    provider_counts = [_count_providers(resource) for resource in manager.registry.values()]
     fig, ax = plt.subplots(figsize=SINGLE_FIG)
     sns.barplot(
         data=sorted(Counter(provider_counts).items()), errorbar=None, color="blue", alpha=0.4, ax=ax
@@ -445,7 +444,7 @@ def _count_providers(resource: Resource) -> int:
 
 def _remap(*, key: str, prefixes: Collection[str]) -> set[str]:
     br_external_to = {}
-    for br_id, resource in read_registry().items():
+    for br_id, resource in manager.registry.items():
         _k = (resource.model_dump().get(key) or {}).get("prefix")
         if _k:
             br_external_to[_k] = br_id
@@ -644,13 +643,13 @@ def plot_xrefs(registry_infos: list[RegistryInfo], watermark: bool) -> FigAxPair
 
     xref_counts = [
         sum(0 < len(entry.get_external(key)) for key, *_ in registry_infos)
-        for entry in read_registry().values()
+        for entry in manager.registry.values()
     ]
     fig, ax = plt.subplots(1, 1, figsize=SINGLE_FIG)
     xrefs_counter: typing.Counter[int] = Counter(xref_counts)
 
     mappable_metaprefixes = {
-        metaprefix for entry in read_registry().values() for metaprefix in entry.get_mappings()
+        metaprefix for entry in manager.registry.values() for metaprefix in entry.get_mappings()
     }
     n_mappable_metaprefixes = len(mappable_metaprefixes)
     max_mapped = max(xrefs_counter)
@@ -0,0 +1,344 @@
+"""Stream IRIs in N-Triples and N-Quads files into CURIEs."""
+
+from __future__ import annotations
+
+import gzip
+import os
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from multiprocessing.pool import AsyncResult, Pool
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+import click
+
+if TYPE_CHECKING:
+    from .resource_manager import Manager, URIPrefixIndex
+
+__all__ = [
+    "RDFCompressionSummary",
+    "compress_rdf",
+    "compress_rdf_file",
+]
+
+#: Matches IRIs, blank nodes, and literals (with an optional datatype or language)
+TERM_RE = re.compile(r'<[^>]*>|_:\S+|"(?:[^"\\]|\\.)*"(?:\^\^<[^>]*>|@[A-Za-z0-9-]+)?')
+
+#: The number of lines that get sent to a worker process at once
+DEFAULT_CHUNK_SIZE = 50_000
+#: Files bigger than this many bytes get compressed with multiple processes by default
+PARALLEL_SIZE = 256 * 1024 * 1024
+#: The number of distinct IRI heads whose compression gets cached
+HEAD_CACHE_SIZE = 100_000
+#: The number of distinct IRIs whose compression gets cached, e.g., for predicates
+IRI_CACHE_SIZE = 100_000
+
+#: A cached compression for all IRIs with a given head: the CURIE prefix followed
+#: by the delimiter and the number of characters to cut from the IRI, None if the
+#: IRIs can't be compressed, or False if it depends on the rest of the IRI.
+CachedHead = tuple[str, int] | None | bool
+
+
+@dataclass
+class RDFCompressionSummary:
+    """A summary of compressing an RDF file."""
+
+    #: The number of statements (triples or quads) that were written
+    statements: int = 0
+    #: The number of non-empty, non-comment lines that couldn't be split into terms
+    skipped: int = 0
+    #: The number of distinct IRIs that couldn't be compressed
+    unparsable: int = 0
+
+
+@dataclass
+class _Chunk:
+    rows: list[str]
+    unparsable: set[str]
+    skipped: int
+
+
+class _Compressor:
+    """Compresses IRIs with a URI prefix index, caching results per IRI head.
+
+    The head of an IRI is everything up to its last slash or hash. Unless a URI
+    prefix extends past the head, e.g., ``http://purl.obolibrary.org/obo/GO_``, all
+    IRIs with the same head are compressed with the same URI prefix. IRIs that come
+    up over and over again, like predicates and types, are also cached as a whole.
+    """
+
+    def __init__(self, index: URIPrefixIndex, preferred: dict[str, str] | None = None) -> None:
+        self.index = index
+        self.preferred = preferred or {}
+        self.cache: dict[str, CachedHead] = {}
+        self.iri_cache: dict[str, str | None] = {}
+
+    def _get_head(self, head: str) -> CachedHead:
+        if self.index.is_extended(head):
+            return False
+        i = self.index.find(head)
+        if i < 0:
+            return None
+        prefix = self.index.prefixes[i]
+        return f"{self.preferred.get(prefix, prefix)}:", len(self.index.uri_prefixes[i])
+
+    def compress(self, iri: str) -> str | None:
+        """Compress an IRI into a CURIE, if possible."""
+        head = iri[: max(iri.rfind("/"), iri.rfind("#")) + 1]
+        try:
+            cached = self.cache[head]
+        except KeyError:
+            if len(self.cache) >= HEAD_CACHE_SIZE:
+                self.cache.clear()
+            cached = self.cache[head] = self._get_head(head)
+        if cached is None:
+            return None
+        if cached is False:
+            i = self.index.find(iri)
+            if i < 0:
+                return None
+            prefix = self.index.prefixes[i]
+            return f"{self.preferred.get(prefix, prefix)}:{iri[len(self.index.uri_prefixes[i]) :]}"
+        lead, cut = cached  # type:ignore[misc]
+        return lead + iri[cut:]
+
+    def compress_lines(self, lines: Iterable[str], quads: bool) -> _Chunk:
+        """Compress the IRIs in N-Triples or N-Quads lines into TSV rows."""
+        rv = _Chunk(rows=[], unparsable=set(), skipped=0)
+        width = 4 if quads else 3
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            terms = TERM_RE.findall(line)
+            if not 3 <= len(terms) <= width:
+                rv.skipped += 1
+                continue
+            row = []
+            for term in terms:
+                if term[0] == "<":
+                    try:
+                        curie = self.iri_cache[term]
+                    except KeyError:
+                        if len(self.iri_cache) >= IRI_CACHE_SIZE:
+                            self.iri_cache.clear()
+                        curie = self.iri_cache[term] = self.compress(term[1:-1])
+                    if curie is None:
+                        rv.unparsable.add(term[1:-1])
+                    else:
+                        term = curie
+                row.append(term)
+            row.extend("" for _ in range(width - len(row)))
+            rv.rows.append("\t".join(row))
+        return rv
+
+
+def _get_compressor(manager: Manager | None, use_preferred: bool) -> _Compressor:
+    if manager is None:
+        from .resource_manager import manager as default_manager
+
+        manager = default_manager
+    preferred = None
+    if use_preferred:
+        preferred = {
+            prefix: preferred_prefix
+            for prefix in manager.registry
+            if (preferred_prefix := manager.get_preferred_prefix(prefix))
+        }
+    return _Compressor(manager.get_uri_index(), preferred)
+
+
+#: The compressor used in each worker process, see :func:`_init_worker`
+_WORKER_COMPRESSOR: _Compressor | None = None
+
+
+def _init_worker(compressor: _Compressor) -> None:
+    global _WORKER_COMPRESSOR
+    _WORKER_COMPRESSOR = compressor
+
+
+def _compress_chunk(lines: list[str], quads: bool) -> _Chunk:
+    if _WORKER_COMPRESSOR is None:
+        raise RuntimeError("worker wasn't initialized")
+    return _WORKER_COMPRESSOR.compress_lines(lines, quads)
+
+
+def _iter_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def compress_rdf(
+    lines: Iterable[str],
+    output: TextIO,
+    *,
+    quads: bool = False,
+    unparsable: TextIO | None = None,
+    manager: Manager | None = None,
+    use_preferred: bool = False,
+    processes: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> RDFCompressionSummary:
+    """Compress the IRIs in N-Triples or N-Quads lines into a TSV of CURIEs.
+
+    :param lines: An iterable of lines in N-Triples or N-Quads format
+    :param output: A file to write the TSV to. It has columns for the subject,
+        predicate, object, and if ``quads`` is true, the graph. IRIs that can't be
+        compressed, blank nodes, and literals are written as is.
+    :param quads: Are the lines in N-Quads format?
+    :param unparsable: A file to write each distinct IRI that couldn't be compressed to
+    :param manager: A manager. If none, uses the default manager.
+    :param use_preferred: If set to true, uses the "preferred prefix", if available,
+        instead of the canonicalized Bioregistry prefix.
+    :param processes: The number of worker processes. If more than one, chunks of
+        lines are compressed in parallel, and written in order.
+    :param chunk_size: The number of lines per chunk
+
+    :returns: A summary of the compression
+
+    Lines are read and written in chunks, so only a few chunks per process are held in
+    memory at once.
+
+    >>> import io
+    >>> output = io.StringIO()
+    >>> compress_rdf(
+    ...     [
+    ...         "<http://purl.obolibrary.org/obo/GO_0000001> "
+    ...         "<http://www.w3.org/2000/01/rdf-schema#subClassOf> "
+    ...         "<http://purl.obolibrary.org/obo/GO_0048308> ."
+    ...     ],
+    ...     output,
+    ... )
+    RDFCompressionSummary(statements=1, skipped=0, unparsable=0)
+    >>> output.getvalue().split()
+    ['subject', 'predicate', 'object', 'go:0000001', 'rdfs:subClassOf', 'go:0048308']
+    """
+    compressor = _get_compressor(manager, use_preferred)
+    columns = (
+        ["subject", "predicate", "object", "graph"] if quads else ["subject", "predicate", "object"]
+    )
+    output.write("\t".join(columns) + "\n")
+
+    summary = RDFCompressionSummary()
+    seen: set[str] = set()
+
+    def _write(chunk: _Chunk) -> None:
+        if chunk.rows:
+            output.write("\n".join(chunk.rows))
+            output.write("\n")
+        summary.statements += len(chunk.rows)
+        summary.skipped += chunk.skipped
+        for iri in sorted(chunk.unparsable - seen):
+            seen.add(iri)
+            if unparsable is not None:
+                unparsable.write(iri + "\n")
+        summary.unparsable = len(seen)
+
+    chunks = _iter_chunks(lines, chunk_size)
+    if processes <= 1:
+        for chunk in chunks:
+            _write(compressor.compress_lines(chunk, quads))
+        return summary
+
+    with Pool(processes, initializer=_init_worker, initargs=(compressor,)) as pool:
+        # only keep a few chunks per process in flight, so memory stays bounded
+        pending: deque[AsyncResult[_Chunk]] = deque()
+        for chunk in chunks:
+            if len(pending) >= 2 * processes:
+                _write(pending.popleft().get())
+            pending.append(pool.apply_async(_compress_chunk, (chunk, quads)))
+        while pending:
+            _write(pending.popleft().get())
+    return summary
+
+
+def _open(path: Path, mode: str) -> TextIO:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t")  # type:ignore
+    return path.open(mode)  # type:ignore
+
+
+def _is_quads(path: Path) -> bool:
+    suffixes = path.suffixes
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes = suffixes[:-1]
+    return bool(suffixes) and suffixes[-1] == ".nq"
+
+
+def compress_rdf_file(
+    path: str | Path,
+    output_path: str | Path,
+    *,
+    unparsable_path: str | Path | None = None,
+    quads: bool | None = None,
+    processes: int | None = None,
+    **kwargs: Any,
+) -> RDFCompressionSummary:
+    """Compress the IRIs in an N-Triples or N-Quads file into a TSV of CURIEs.
+
+    :param path: The path to an N-Triples or N-Quads file, optionally gzipped
+    :param output_path: The path to write the TSV to, gzipped if it ends with ``.gz``
+    :param unparsable_path: The path to write each distinct IRI that couldn't be
+        compressed to
+    :param quads: Is the file in N-Quads format? If none, this is true if the file
+        has the ``.nq`` or ``.nq.gz`` extension.
+    :param processes: The number of worker processes. If none, uses one per CPU for
+        files bigger than 256 MB and one otherwise.
+    :param kwargs: Remaining keyword arguments to pass to :func:`compress_rdf`
+
+    :returns: A summary of the compression
+    """
+    path = Path(path).expanduser().resolve()
+    output_path = Path(output_path).expanduser().resolve()
+    if quads is None:
+        quads = _is_quads(path)
+    if processes is None:
+        processes = (os.cpu_count() or 1) if path.stat().st_size > PARALLEL_SIZE else 1
+    with _open(path, "r") as file, _open(output_path, "w") as output:
+        if unparsable_path is None:
+            return compress_rdf(file, output, quads=quads, processes=processes, **kwargs)
+        with _open(Path(unparsable_path).expanduser().resolve(), "w") as unparsable:
+            return compress_rdf(
+                file, output, quads=quads, unparsable=unparsable, processes=processes, **kwargs
+            )
+
+
+@click.command(name="compress-rdf")
+@click.argument("path", type=Path)
+@click.option("--output", type=Path, required=True, help="Path to write the TSV of CURIEs to")
+@click.option("--unparsable", type=Path, help="Path to write IRIs that couldn't be compressed to")
+@click.option("--quads/--triples", default=None, help="Defaults to quads for .nq files")
+@click.option("--processes", type=int, help="Defaults to one per CPU for big files")
+@click.option("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, show_default=True)
+@click.option("--use-preferred", is_flag=True, help="Use preferred prefixes")
+def compress_rdf_command(
+    path: Path,
+    output: Path,
+    unparsable: Path | None,
+    quads: bool | None,
+    processes: int | None,
+    chunk_size: int,
+    use_preferred: bool,
+) -> None:
+    """Compress the IRIs in an N-Triples or N-Quads file into a TSV of CURIEs."""
+    summary = compress_rdf_file(
+        path,
+        output,
+        unparsable_path=unparsable,
+        quads=quads,
+        processes=processes,
+        chunk_size=chunk_size,
+        use_preferred=use_preferred,
+    )
+    click.echo(
+        f"wrote {summary.statements:,} statements, skipped {summary.skipped:,} lines,"
+        f" and couldn't compress {summary.unparsable:,} distinct IRIs"
+    )
@@ -2,7 +2,7 @@
 
 import csv
 import json
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from pathlib import Path
 from typing import Any, ClassVar, ParamSpec, TypeAlias
 
@@ -114,7 +114,7 @@ class Aligner:
         self._align()
 
     @property
-    def internal_registry(self) -> dict[str, Resource]:
+    def internal_registry(self) -> MutableMapping[str, Resource]:
         """Get the internal registry."""
         return self.manager.registry
 
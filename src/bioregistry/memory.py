@@ -0,0 +1,101 @@
+"""Account for the memory used by the registry, per external registry."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import click
+
+__all__ = [
+    "MemoryUsage",
+    "get_memory_usage",
+    "memory",
+]
+
+#: The key used for fields curated in the Bioregistry itself
+INTERNAL_KEY = "bioregistry"
+
+
+@dataclass
+class MemoryUsage:
+    """The memory used by the fields coming from one registry."""
+
+    #: The number of records that have a field for the registry
+    records: int = 0
+    #: The number of bytes used, counting objects shared with other fields only once
+    size: int = 0
+    #: The number of bytes that would be used if nothing were shared
+    unshared_size: int = 0
+
+
+def get_memory_usage(
+    records: Mapping[str, Mapping[str, Any]], metaprefixes: Iterable[str]
+) -> dict[str, MemoryUsage]:
+    """Get the memory used by raw registry records, grouped by registry.
+
+    :param records: A mapping from prefixes to raw records, like in ``bioregistry.json``
+    :param metaprefixes: The metaprefixes of external registries. Fields of records
+        with one of these names get counted for that registry, and all other fields
+        get counted for the Bioregistry.
+
+    :returns: A dictionary from metaprefixes to their memory usage. Objects that are
+        shared between fields, e.g., interned strings, are only counted for the first
+        field in which they appear.
+    """
+    metaprefixes = set(metaprefixes)
+    rv: dict[str, MemoryUsage] = {}
+    seen: set[int] = set()
+    for record in records.values():
+        keys = set()
+        for key, value in record.items():
+            usage = rv.setdefault(key if key in metaprefixes else INTERNAL_KEY, MemoryUsage())
+            usage.size += _get_size(key, seen) + _get_size(value, seen)
+            usage.unshared_size += _get_size(key, set()) + _get_size(value, set())
+            keys.add(key if key in metaprefixes else INTERNAL_KEY)
+        for key in keys:
+            rv[key].records += 1
+    return rv
+
+
+def _get_size(obj: Any, seen: set[int]) -> int:
+    """Get the size of a JSON-like object and everything it contains that isn't in seen."""
+    rv = 0
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        rv += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return rv
+
+
+@click.command()
+@click.option("--registry", type=Path, help="Path to a local registry file")
+def memory(registry: Path | None) -> None:
+    """Report the memory used by the registry, per external registry."""
+    from .constants import BIOREGISTRY_PATH
+    from .schema_utils import _parse_registry, read_metaregistry
+
+    records = _parse_registry(registry or BIOREGISTRY_PATH)
+    usages = get_memory_usage(records, read_metaregistry())
+    width = max((len(key) for key in usages), default=len("registry"))
+    click.echo(f"{'registry':<{width}} {'records':>8} {'size':>12} {'unshared':>12}")
+    for key, usage in sorted(usages.items(), key=lambda item: item[1].size, reverse=True):
+        click.echo(
+            f"{key:<{width}} {usage.records:>8,} {usage.size:>12,} {usage.unshared_size:>12,}"
+        )
+    click.echo(
+        f"{'total':<{width}} {len(records):>8,}"
+        f" {sum(usage.size for usage in usages.values()):>12,}"
+        f" {sum(usage.unshared_size for usage in usages.values()):>12,}"
+    )
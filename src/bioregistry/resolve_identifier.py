@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 
 from .resolve import get_resource
 from .resource_manager import manager
@@ -25,6 +25,7 @@ __all__ = [
     "is_valid_identifier",
     "miriam_standardize_identifier",
     "standardize_identifier",
+    "standardize_identifiers",
 ]
 
 
@@ -214,6 +215,15 @@ def standardize_identifier(prefix: str, identifier: str) -> str:
     return resource.standardize_identifier(identifier)
 
 
+def standardize_identifiers(prefix: str, identifiers: Iterable[str]) -> list[str]:
+    """Normalize many identifiers with the same prefix.
+
+    >>> standardize_identifiers("go", ["GO:0000001", "0000002"])
+    ['0000001', '0000002']
+    """
+    return manager.standardize_identifiers(prefix, identifiers)
+
+
 def miriam_standardize_identifier(prefix: str, identifier: str) -> str | None:
     """Normalize the identifier with the appropriate banana.
 
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
+import threading
 import typing
+from bisect import bisect_right
 from collections import Counter, defaultdict
-from collections.abc import Callable, Iterable, Mapping, Sequence
-from dataclasses import dataclass
-from functools import cache
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
     Any,
     Generic,
     Literal,
     TypeVar,
+    cast,
     overload,
 )
 
@@ -23,21 +27,18 @@ from curies.api import NoCURIEDelimiterError, PrefixStandardizationError
 from pydantic import BaseModel
 
 from .constants import (
-    BIOREGISTRY_PATH,
     BIOREGISTRY_REMOTE_URL,
-    COLLECTIONS_PATH,
-    CONTEXTS_PATH,
     EXTRAS,
     HEALTH_BASE,
     IDENTIFIERS_ORG_URL_PREFIX,
     LINK_PRIORITY,
-    METAREGISTRY_PATH,
     SHIELDS_BASE,
     FailureReturnType,
     MaybeCURIE,
     NonePair,
     get_failure_return_type,
 )
+from .resource_view import ResourceView, _CompressedRecords
 from .schema import (
     Attributable,
     Collection,
@@ -50,21 +51,33 @@ from .schema import (
 )
 from .schema.struct import OlsVersion
 from .schema_utils import (
+    LazyRegistry,
     _collections_from_path,
     _contexts_from_path,
     _read_metaregistry,
     _registry_from_path,
+    read_collections,
+    read_contexts,
     read_has_version_mappings,
+    read_metaregistry,
     read_mismatches,
     read_provided_by_mappings,
+    read_registry,
     write_collections,
     write_registry,
 )
 from .utils import NormDict, get_ec_url
 
+if typing.TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
 __all__ = [
+    "BulkValidationResult",
     "Manager",
     "MetaresourceAnnotatedValue",
+    "RegistryMappingIndex",
+    "URIPrefixIndex",
     "manager",
 ]
 
@@ -72,6 +85,9 @@ logger = logging.getLogger(__name__)
 
 X = TypeVar("X", bound=int | str)
 
+#: The number of raw prefixes whose normalization gets memoized per manager
+PREFIX_CACHE_SIZE = 4096
+
 
 @dataclass
 class MetaresourceAnnotatedValue(Generic[X]):
@@ -100,13 +116,13 @@ def _synonym_to_canonical(registry: Mapping[str, Resource]) -> NormDict:
     """Return a mapping from several variants of each synonym to the canonical namespace."""
     norm_synonym_to_key = NormDict()
 
-    for identifier, resource in registry.items():
+    for identifier in registry:
         norm_synonym_to_key[identifier] = identifier
-        for synonym in resource.synonyms or []:
+        for synonym in _get_field(registry, identifier, "synonyms") or []:
             norm_synonym_to_key[synonym] = identifier
 
         for metaprefix in ("miriam", "ols", "obofoundry", "go"):
-            external = resource.get_external(metaprefix)
+            external = _get_field(registry, identifier, metaprefix)
             if external is None:
                 continue
             external_prefix = external.get("prefix")
@@ -118,6 +134,174 @@ def _synonym_to_canonical(registry: Mapping[str, Resource]) -> NormDict:
     return norm_synonym_to_key
 
 
+def _get_field(registry: Mapping[str, Resource], prefix: str, key: str) -> Any:
+    """Get a field of a resource, avoiding validation for lazy registries."""
+    if isinstance(registry, LazyRegistry):
+        return registry.get_field(prefix, key)
+    return getattr(registry[prefix], key)
+
+
+def _get_obo_preferred_prefix(obofoundry: Mapping[str, Any] | None) -> str | None:
+    """Get the OBO Foundry preferred prefix, like :meth:`Resource.get_mapped_prefix` does."""
+    if not obofoundry:
+        return None
+    if "preferred_prefix" in obofoundry:
+        return cast(str, obofoundry["preferred_prefix"])
+    if "prefix" in obofoundry:
+        return cast(str, obofoundry["prefix"]).upper()
+    return None
+
+
+@dataclass
+class RegistryMappingIndex:
+    """Mappings between Bioregistry prefixes and the prefixes in all external registries.
+
+    This is built in one pass over the registry by :meth:`Manager.get_mapping_index`.
+    """
+
+    #: A dictionary from metaprefixes to Bioregistry prefixes to external prefixes
+    maps: dict[str, dict[str, str]] = field(default_factory=dict)
+    #: A dictionary from metaprefixes to external prefixes to Bioregistry prefixes
+    invmaps: dict[str, dict[str, str]] = field(default_factory=dict)
+    #: A dictionary from Bioregistry prefixes to OBO Foundry preferred prefixes
+    obo_preferred_map: dict[str, str] = field(default_factory=dict)
+    #: A dictionary from OBO Foundry preferred prefixes to Bioregistry prefixes
+    obo_preferred_invmap: dict[str, str] = field(default_factory=dict)
+    #: A dictionary from metaprefixes to the external prefixes from version and
+    #: provided by mappings, which take precedence in the inverse maps
+    extra_external_prefixes: dict[str, set[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_registry(
+        cls,
+        registry: Mapping[str, Resource],
+        extras_dicts: Iterable[Mapping[str, Mapping[str, typing.Collection[str]]]] = (),
+    ) -> RegistryMappingIndex:
+        """Build an index from a registry, and version or provided by mappings."""
+        rv = cls()
+        for prefix in registry:
+            rv._add(
+                prefix,
+                _get_field(registry, prefix, "mappings"),
+                _get_field(registry, prefix, "obofoundry"),
+            )
+        for extras_dict in extras_dicts:
+            for prefix, data in extras_dict.items():
+                for metaprefix, external_prefixes in data.items():
+                    invmaps = [rv.invmaps.setdefault(metaprefix, {})]
+                    if metaprefix == "obofoundry":
+                        invmaps.append(rv.obo_preferred_invmap)
+                    for external_prefix in external_prefixes:
+                        rv.extra_external_prefixes.setdefault(metaprefix, set()).add(
+                            external_prefix
+                        )
+                        for invmap in invmaps:
+                            invmap[external_prefix] = prefix
+        return rv
+
+    def add_resource(self, resource: Resource) -> None:
+        """Add a resource's mappings, e.g., after it's added to a manager."""
+        self._add(resource.prefix, resource.mappings, resource.obofoundry)
+
+    def _add(
+        self,
+        prefix: str,
+        mappings: Mapping[str, str] | None,
+        obofoundry: Mapping[str, Any] | None,
+    ) -> None:
+        for metaprefix, external_prefix in (mappings or {}).items():
+            self.maps.setdefault(metaprefix, {})[prefix] = external_prefix
+            if external_prefix not in self.extra_external_prefixes.get(metaprefix, ()):
+                self.invmaps.setdefault(metaprefix, {})[external_prefix] = prefix
+        if obo_preferred_prefix := _get_obo_preferred_prefix(obofoundry):
+            self.obo_preferred_map[prefix] = obo_preferred_prefix
+            if obo_preferred_prefix not in self.extra_external_prefixes.get("obofoundry", ()):
+                self.obo_preferred_invmap[obo_preferred_prefix] = prefix
+
+    def get_map(self, metaprefix: str, *, use_obo_preferred: bool = False) -> dict[str, str]:
+        """Get a mapping from Bioregistry prefixes to prefixes in the external registry."""
+        if metaprefix == "obofoundry" and use_obo_preferred:
+            return self.obo_preferred_map
+        return self.maps.setdefault(metaprefix, {})
+
+    def get_invmap(self, metaprefix: str, *, use_obo_preferred: bool = False) -> dict[str, str]:
+        """Get a mapping from prefixes in the external registry to Bioregistry prefixes."""
+        if metaprefix == "obofoundry" and use_obo_preferred:
+            return self.obo_preferred_invmap
+        return self.invmaps.setdefault(metaprefix, {})
+
+
+class URIPrefixIndex:
+    """An index for finding the longest URI prefix that matches a URI.
+
+    The URI prefixes are kept in a sorted list, so the longest match can be found with
+    a binary search instead of walking a trie one character at a time. The greatest
+    URI prefix that sorts before the URI either matches it, or the longest match is the
+    longest URI prefix that's also a prefix of that one. These are precomputed, so
+    parsing a URI only takes a few string comparisons.
+
+    >>> index = URIPrefixIndex(
+    ...     {
+    ...         "https://example.org/": "a",
+    ...         "https://example.org/b/": "b",
+    ...         "https://example.org/c/": "c",
+    ...     }
+    ... )
+    >>> index.parse_uri("https://example.org/b/1")
+    ('b', '1')
+    >>> index.parse_uri("https://example.org/bb/1")
+    ('a', 'bb/1')
+    >>> index.parse_uri("https://example.com/1") is None
+    True
+    """
+
+    __slots__ = ("parents", "prefixes", "uri_prefixes")
+
+    def __init__(self, reverse_prefix_map: Mapping[str, str]) -> None:
+        """Build the index.
+
+        :param reverse_prefix_map: A mapping from URI prefixes to prefixes, e.g., from
+            :attr:`curies.Converter.reverse_prefix_map`
+        """
+        self.uri_prefixes = sorted(uri_prefix for uri_prefix in reverse_prefix_map if uri_prefix)
+        self.prefixes = [reverse_prefix_map[uri_prefix] for uri_prefix in self.uri_prefixes]
+        #: The position of the longest URI prefix that's a prefix of the one at each
+        #: position, or -1 if there isn't any
+        self.parents: list[int] = []
+        stack: list[int] = []
+        for i, uri_prefix in enumerate(self.uri_prefixes):
+            # in sorted order, all URI prefixes that start with another one come right
+            # after it, so the stack holds the chain of prefixes of the current one
+            while stack and not uri_prefix.startswith(self.uri_prefixes[stack[-1]]):
+                stack.pop()
+            self.parents.append(stack[-1] if stack else -1)
+            stack.append(i)
+
+    def __len__(self) -> int:
+        """Get the number of URI prefixes in the index."""
+        return len(self.uri_prefixes)
+
+    def parse_uri(self, uri: str) -> tuple[str, str] | None:
+        """Get the prefix and identifier for the longest matching URI prefix, if any."""
+        i = self.find(uri)
+        if i < 0:
+            return None
+        return self.prefixes[i], uri[len(self.uri_prefixes[i]) :]
+
+    def find(self, uri: str) -> int:
+        """Get the position of the longest URI prefix of the URI, or -1 if there's none."""
+        uri_prefixes = self.uri_prefixes
+        i = bisect_right(uri_prefixes, uri) - 1
+        while i >= 0 and not uri.startswith(uri_prefixes[i]):
+            i = self.parents[i]
+        return i
+
+    def is_extended(self, uri: str) -> bool:
+        """Check if any URI prefix starts with the URI and is longer than it."""
+        i = bisect_right(self.uri_prefixes, uri)
+        return i < len(self.uri_prefixes) and self.uri_prefixes[i].startswith(uri)
+
+
 class MappingsDiff(BaseModel):
     """A difference between two mappings sets."""
 
@@ -128,16 +312,44 @@ class MappingsDiff(BaseModel):
     mappings: dict[str, str]
 
 
+@dataclass
+class BulkValidationResult:
+    """The results of validating many identifiers or CURIEs at once.
+
+    See :meth:`Manager.validate_identifiers` and :meth:`Manager.validate_curies`.
+    """
+
+    #: A boolean mask that's true for the rows that are valid
+    mask: NDArray[np.bool_]
+    #: The number of rows for each prefix that couldn't be looked up
+    invalid_prefixes: Counter[str] = field(default_factory=Counter)
+    #: The number of rows for each (normalized) prefix whose identifier doesn't match
+    #: the prefix's pattern
+    invalid_identifiers: Counter[str] = field(default_factory=Counter)
+    #: The number of CURIEs without a delimiter
+    malformed: int = 0
+
+
 class Manager:
     """A manager for functionality related to a metaregistry."""
 
-    registry: dict[str, Resource]
+    registry: MutableMapping[str, Resource]
     metaregistry: dict[str, Registry]
     collections: dict[str, Collection]
     contexts: dict[str, Context]
     mismatches: Mapping[str, Mapping[str, set[str]]]
+    canonical_for: dict[str, list[str]]
+    provided_by: dict[str, list[str]]
+    has_parts: dict[str, list[str]]
+    in_collection: dict[str, list[str]]
+
+    #: Compact views of resources, for frozen managers. See :meth:`freeze`.
+    views: dict[str, ResourceView] | None
 
     _converter: curies.Converter | None
+    _mapping_index: RegistryMappingIndex | None
+    _uri_index: URIPrefixIndex | None
+    _lookup_prefix: functools._lru_cache_wrapper[str | None]
 
     def __init__(
         self,
@@ -153,6 +365,10 @@ class Manager:
         """Instantiate a registry manager.
 
         :param registry: A custom registry. If none given, defaults to the Bioregistry.
+            The default registry, metaregistry, collections, and contexts are
+            shared with :func:`bioregistry.read_registry` and the related functions,
+            so they're only parsed once per process. Adding resources or collections
+            to a manager doesn't affect them.
         :param metaregistry: A custom metaregistry. If none, defaults to the
             Bioregistry's metaregistry.
         :param collections: A custom collections dictionary. If none, defaults to the
@@ -166,29 +382,33 @@ class Manager:
         self.base_url = (base_url or BIOREGISTRY_REMOTE_URL).rstrip()
 
         if registry is None:
-            self.registry = dict(_registry_from_path(BIOREGISTRY_PATH))
+            registry = read_registry()
         elif isinstance(registry, str | Path):
-            self.registry = dict(_registry_from_path(registry))
+            registry = _registry_from_path(registry)
+        if isinstance(registry, LazyRegistry):
+            # resources only get validated when they're first used
+            self.registry = registry.copy()
         else:
             self.registry = dict(registry)
         self.synonyms = _synonym_to_canonical(self.registry)
+        self._reset_prefix_cache()
 
         if metaregistry is None:
-            self.metaregistry = dict(_read_metaregistry(METAREGISTRY_PATH))
+            self.metaregistry = dict(read_metaregistry())
         elif isinstance(metaregistry, str | Path):
             self.metaregistry = dict(_read_metaregistry(metaregistry))
         else:
             self.metaregistry = dict(metaregistry)
 
         if collections is None:
-            self.collections = dict(_collections_from_path(COLLECTIONS_PATH))
+            self.collections = dict(read_collections())
         elif isinstance(collections, str | Path):
             self.collections = dict(_collections_from_path(collections))
         else:
             self.collections = dict(collections)
 
         if contexts is None:
-            self.contexts = dict(_contexts_from_path(CONTEXTS_PATH))
+            self.contexts = dict(read_contexts())
         elif isinstance(contexts, str | Path):
             self.contexts = dict(_contexts_from_path(contexts))
         else:
@@ -202,39 +422,187 @@ class Manager:
             read_provided_by_mappings() if provided_by_mappings is None else provided_by_mappings
         )
 
-        canonical_for = defaultdict(list)
-        provided_by = defaultdict(list)
-        has_parts = defaultdict(list)
-        for prefix, resource in self.registry.items():
-            if resource.has_canonical:
-                canonical_for[resource.has_canonical].append(prefix)
-            if resource.provides:
-                provided_by[resource.provides].append(prefix)
-            if resource.part_of:
-                has_parts[resource.part_of].append(prefix)
-        self.canonical_for = dict(canonical_for)
-        self.provided_by = dict(provided_by)
-        self.has_parts = dict(has_parts)
-
-        in_collection = defaultdict(list)
-        for cid, collection in self.collections.items():
-            for prefix in collection.get_prefixes():
-                in_collection[prefix].append(cid)
-        self.in_collection = dict(in_collection)
+        self.canonical_for = {}
+        self.provided_by = {}
+        self.has_parts = {}
+        for prefix in self.registry:
+            self._index_relations(prefix)
+
+        self.in_collection = {}
+        for collection in self.collections.values():
+            self._index_collection(collection)
+
+        self._converter = None
+        self._mapping_index = None
+        self._uri_index = None
+        self.views = None
+
+    def _index_relations(self, prefix: str) -> None:
+        """Add the resource's canonical, provides, and part of relations to the indexes."""
+        for key, index in self._iter_relation_indexes():
+            if value := _get_field(self.registry, prefix, key):
+                index[value] = [*index.get(value, []), prefix]
+
+    def _unindex_relations(self, prefix: str) -> None:
+        """Remove the resource's canonical, provides, and part of relations from the indexes."""
+        for key, index in self._iter_relation_indexes():
+            if (value := _get_field(self.registry, prefix, key)) and prefix in index.get(value, []):
+                index[value] = [p for p in index[value] if p != prefix]
+                if not index[value]:
+                    del index[value]
+
+    def _iter_relation_indexes(self) -> Iterable[tuple[str, dict[str, list[str]]]]:
+        yield "has_canonical", self.canonical_for
+        yield "provides", self.provided_by
+        yield "part_of", self.has_parts
+
+    def _index_collection(self, collection: Collection) -> None:
+        """Add the collection to the index of collections for each of its prefixes."""
+        for prefix in collection.get_prefixes():
+            self.in_collection[prefix] = [
+                *self.in_collection.get(prefix, []),
+                collection.identifier,
+            ]
+
+    def freeze(self) -> Manager:
+        """Get a read-only copy of this manager that uses less memory, e.g., for serving.
 
+        :returns: A manager that uses a compact :class:`ResourceView` of each resource
+            for parsing, standardizing, validating, and resolving. The full resources
+            are kept compressed and only get loaded again when they're needed, e.g.,
+            by :meth:`get_resource`. Resources can't be added to a frozen manager.
+
+        >>> from bioregistry import manager
+        >>> frozen = manager.freeze()
+        >>> frozen.normalize_curie("GO:GO:0000001")
+        'go:0000001'
+        """
+        rv = copy.copy(self)
+        # build the converter and mapping index up front since they need all resources.
+        # They get updated in place when adding resources, so this manager rebuilds
+        # its own if needed
+        rv._converter = self.converter
+        rv._mapping_index = self.get_mapping_index()
         self._converter = None
+        self._mapping_index = None
+        self._uri_index = None
+        # don't share indexes that get updated when adding resources to this manager
+        rv.synonyms = copy.copy(self.synonyms)
+        rv._reset_prefix_cache()
+        rv.canonical_for = dict(self.canonical_for)
+        rv.provided_by = dict(self.provided_by)
+        rv.has_parts = dict(self.has_parts)
+        rv.in_collection = dict(self.in_collection)
+        rv.views = {prefix: ResourceView(resource) for prefix, resource in self.registry.items()}
+        rv.registry = LazyRegistry(_CompressedRecords(self.registry)).copy(read_only=True)
+        return rv
+
+    def _reset_prefix_cache(self) -> None:
+        """Memoize looking up raw prefixes in the synonyms, including misses."""
+        self._lookup_prefix = functools.lru_cache(maxsize=PREFIX_CACHE_SIZE)(self.synonyms.get)
+
+    def get_prefix_cache_info(self) -> functools._CacheInfo:
+        """Get the hits, misses, and size of the cache used by :meth:`normalize_prefix`.
+
+        >>> from bioregistry import Manager
+        >>> manager = Manager()
+        >>> manager.normalize_prefix("GO")
+        'go'
+        >>> manager.normalize_prefix("GO")
+        'go'
+        >>> manager.get_prefix_cache_info().hits
+        1
+        """
+        return self._lookup_prefix.cache_info()
+
+    def _get_view(self, prefix: str) -> Resource | ResourceView | None:
+        """Get the compact view of a resource if frozen, otherwise the resource itself."""
+        if self.views is None:
+            return self.get_resource(prefix)
+        norm_prefix = self.normalize_prefix(prefix)
+        if norm_prefix is None:
+            return None
+        return self.views.get(norm_prefix)
 
     def add_resource(self, resource: Resource) -> None:
-        """Add a custom resource to the manager."""
-        self.synonyms[resource.prefix] = resource.prefix
-        self.registry[resource.prefix] = resource
-        if self._converter is not None and (uri_prefix := resource.get_uri_prefix()):
-            self._converter.add_prefix(resource.prefix, uri_prefix)
-            # TODO what about synonyms
+        """Add a custom resource to the manager.
+
+        :param resource: The resource to add. If a resource with the same prefix already
+            exists, it gets replaced.
+
+        :raises TypeError: If the manager is frozen
+        :raises KeyError: If the prefix or one of its synonyms is already used by
+            another resource
+
+        The synonyms, relations, registry mappings, and default converter get updated
+        in place, so this only costs as much as indexing the new resource.
+
+        >>> from bioregistry import Manager, Resource
+        >>> manager = Manager()
+        >>> manager.add_resource(
+        ...     Resource(
+        ...         prefix="myprefix",
+        ...         synonyms=["MYPREFIX_SYN"],
+        ...         uri_format="https://example.org/myprefix/$1",
+        ...         provides="go",
+        ...     )
+        ... )
+        >>> manager.normalize_prefix("myprefix_syn")
+        'myprefix'
+        >>> "myprefix" in manager.get_provided_by("go")
+        True
+        """
+        if self.views is not None:
+            raise TypeError("can't add resources to a frozen manager")
+        prefix = resource.prefix
+        for key in (prefix, *(resource.synonyms or [])):
+            existing = self.synonyms.get(key)
+            if existing is not None and existing != prefix:
+                raise KeyError(f"can't add {prefix} since {key} is already used by {existing}")
+
+        replace = prefix in self.registry
+        if replace:
+            self._unindex_resource(prefix)
+
+        # the resource might have been modified in place before getting added
+        resource.clear_resolved()
+        self.registry[prefix] = resource
+        self.synonyms[prefix] = prefix
+        for synonym in resource.synonyms or []:
+            self.synonyms[synonym] = prefix
+        # previous misses might be hits now
+        self._reset_prefix_cache()
+        self._index_relations(prefix)
+        # this is cheap enough to rebuild from the converter on next use
+        self._uri_index = None
+
+        if replace:
+            # records can't be taken out of a converter, so rebuild these on next use
+            self._converter = None
+            self._mapping_index = None
+            return
+
+        if self._mapping_index is not None:
+            self._mapping_index.add_resource(resource)
+        if self._converter is not None:
+            record_accumulator.add_resource(self._converter, resource)
+
+    def _unindex_resource(self, prefix: str) -> None:
+        """Remove a resource's synonyms and relations from the indexes."""
+        for synonym in _get_field(self.registry, prefix, "synonyms") or []:
+            if self.synonyms.get(synonym) == prefix:
+                del self.synonyms[synonym]
+        self._unindex_relations(prefix)
 
     def add_collection(self, collection: Collection) -> None:
         """Add a collection."""
+        if (existing := self.collections.get(collection.identifier)) is not None:
+            for prefix in existing.get_prefixes():
+                self.in_collection[prefix] = [
+                    cid for cid in self.in_collection[prefix] if cid != collection.identifier
+                ]
         self.collections[collection.identifier] = collection
+        self._index_collection(collection)
 
     def add_to_collection(self, collection: str | Collection, resource: str | Resource) -> None:
         """Add a resource to the collection."""
@@ -244,7 +612,12 @@ class Manager:
             resource = resource.prefix
         elif resource not in self.registry:
             raise ValueError
-        self.collections[collection].resources.append(resource)
+        # collections can be shared with other managers, so copy before modifying
+        value = self.collections[collection]
+        self.collections[collection] = value.model_copy(
+            update={"resources": [*value.resources, resource]}
+        )
+        self.in_collection[resource] = [*self.in_collection.get(resource, []), collection]
 
     @property
     def converter(self) -> curies.Converter:
@@ -372,13 +745,14 @@ class Manager:
         :raises PrefixStandardizationError: If strict is set to true and the prefix
             could not be standardized
         """
-        norm_prefix = self.synonyms.get(prefix)
+        norm_prefix = self._lookup_prefix(prefix)
         if norm_prefix is None:
             if strict:
                 raise PrefixStandardizationError(prefix)
             return None
         if use_preferred:
-            norm_prefix = self.registry[norm_prefix].get_preferred_prefix() or norm_prefix
+            resource = self.registry[norm_prefix] if self.views is None else self.views[norm_prefix]
+            norm_prefix = resource.get_preferred_prefix() or norm_prefix
         return norm_prefix
 
     # docstr-coverage:excused `overload`
@@ -512,6 +886,62 @@ class Manager:
             return self.make_preferred(reference, use_preferred=use_preferred)
         return get_failure_return_type(on_failure_return_type)
 
+    def get_uri_index(self) -> URIPrefixIndex:
+        """Get an index over the URI prefixes in the default converter, building it if needed.
+
+        >>> from bioregistry import manager
+        >>> manager.get_uri_index().parse_uri("http://purl.obolibrary.org/obo/GO_0000001")
+        ('go', '0000001')
+        """
+        if self._uri_index is None:
+            self._uri_index = URIPrefixIndex(self.converter.reverse_prefix_map)
+        return self._uri_index
+
+    def parse_uris(
+        self, uris: Iterable[str], *, use_preferred: bool = False
+    ) -> tuple[list[str | None], list[str | None]]:
+        """Parse many URIs into prefixes and identifiers.
+
+        :param uris: An iterable of URIs
+        :param use_preferred: If set to true, uses the "preferred prefix", if available,
+            instead of the canonicalized Bioregistry prefix.
+
+        :returns: A pair of lists with the prefix and identifier for each URI, in the
+            same order. Both are None for URIs that can't be parsed.
+
+        This gives the same results as calling :meth:`parse_uri` on each URI, but uses
+        the index from :meth:`get_uri_index`, which is much faster for many URIs.
+
+        >>> from bioregistry import manager
+        >>> manager.parse_uris(
+        ...     [
+        ...         "http://purl.obolibrary.org/obo/GO_0000001",
+        ...         "https://bioregistry.io/chebi:1234",
+        ...         "https://example.org/nope",
+        ...     ]
+        ... )
+        (['go', 'chebi', None], ['0000001', '1234', None])
+        """
+        parse_uri = self.get_uri_index().parse_uri
+        preferred: dict[str, str] = {}
+        prefixes: list[str | None] = []
+        identifiers: list[str | None] = []
+        for uri in uris:
+            pair = parse_uri(uri)
+            if pair is None:
+                prefixes.append(None)
+                identifiers.append(None)
+                continue
+            prefix, identifier = pair
+            if use_preferred:
+                try:
+                    prefix = preferred[prefix]
+                except KeyError:
+                    prefix = preferred[prefix] = self.get_preferred_prefix(prefix) or prefix
+            prefixes.append(prefix)
+            identifiers.append(identifier)
+        return prefixes, identifiers
+
     def make_preferred(self, t: ReferenceTuple, use_preferred: bool = False) -> ReferenceTuple:
         """Replace a reference tuple's prefix with a preferred one."""
         if not use_preferred:
@@ -769,20 +1199,157 @@ class Manager:
             if strict:
                 raise PrefixStandardizationError(prefix)
             return get_failure_return_type(on_failure_return_type)
-        resource = self.registry[norm_prefix]
+        resource = self.registry[norm_prefix] if self.views is None else self.views[norm_prefix]
         norm_identifier = resource.standardize_identifier(identifier)
         if use_preferred:
             norm_prefix = resource.get_preferred_prefix() or norm_prefix
         return ReferenceTuple(norm_prefix, norm_identifier)
 
-    @cache  # noqa:B019
+    def parse_curies(
+        self,
+        curies: Iterable[str],
+        *,
+        sep: str = ":",
+        use_preferred: bool = False,
+        strict: bool = False,
+    ) -> tuple[list[str | None], list[str | None]]:
+        """Parse many CURIEs and normalize their prefixes and identifiers.
+
+        :param curies: An iterable of CURIEs
+        :param sep: The separator between prefixes and identifiers
+        :param use_preferred: If set to true, uses the "preferred prefix", if available,
+            instead of the canonicalized Bioregistry prefix.
+        :param strict: If true, raises an error on the first CURIE that can't be parsed
+
+        :returns: A pair of lists with the normalized prefix and identifier for each
+            CURIE, in the same order. Both are None for CURIEs that can't be parsed.
+
+        :raises NoCURIEDelimiterError: If strict is set to true and a CURIE doesn't
+            contain the separator
+        :raises PrefixStandardizationError: If strict is set to true and a prefix could
+            not be standardized
+
+        This gives the same results as calling :meth:`parse_curie` on each CURIE, but
+        each distinct prefix only gets looked up once.
+
+        >>> from bioregistry import manager
+        >>> manager.parse_curies(["GO:GO:0000001", "go:0000002", "nope:1", "nope"])
+        (['go', 'go', None, None], ['0000001', '0000002', None, None])
+        """
+        prefixes: list[str | None] = []
+        identifiers: list[str | None] = []
+        resolved: dict[str, tuple[str, Callable[[str], str]] | None] = {}
+        for curie in curies:
+            prefix, delimiter, identifier = curie.partition(sep)
+            if not delimiter:
+                if strict:
+                    raise NoCURIEDelimiterError(curie)
+                prefixes.append(None)
+                identifiers.append(None)
+                continue
+            try:
+                pair = resolved[prefix]
+            except KeyError:
+                pair = resolved[prefix] = self._resolve_prefix(prefix, use_preferred=use_preferred)
+            if pair is None:
+                if strict:
+                    raise PrefixStandardizationError(prefix)
+                prefixes.append(None)
+                identifiers.append(None)
+                continue
+            norm_prefix, strip = pair
+            prefixes.append(norm_prefix)
+            identifiers.append(strip(identifier))
+        return prefixes, identifiers
+
+    def normalize_curies(
+        self,
+        curies: Iterable[str],
+        *,
+        sep: str = ":",
+        use_preferred: bool = False,
+        strict: bool = False,
+    ) -> list[str | None]:
+        """Normalize the prefixes and identifiers in many CURIEs.
+
+        :param curies: An iterable of CURIEs
+        :param sep: The separator between prefixes and identifiers
+        :param use_preferred: If set to true, uses the "preferred prefix", if available,
+            instead of the canonicalized Bioregistry prefix.
+        :param strict: If true, raises an error on the first CURIE that can't be parsed
+
+        :returns: A list with the normalized CURIE for each CURIE, in the same order,
+            or None for CURIEs that can't be parsed. See :meth:`parse_curies`.
+
+        >>> from bioregistry import manager
+        >>> manager.normalize_curies(["GO:GO:0000001", "nope:1"])
+        ['go:0000001', None]
+        """
+        prefixes, identifiers = self.parse_curies(
+            curies, sep=sep, use_preferred=use_preferred, strict=strict
+        )
+        return [
+            None if prefix is None else f"{prefix}:{identifier}"
+            for prefix, identifier in zip(prefixes, identifiers, strict=True)
+        ]
+
+    def standardize_identifiers(self, prefix: str, identifiers: Iterable[str]) -> list[str]:
+        """Remove bananas and redundant prefixes from many identifiers with the same prefix.
+
+        :param prefix: The prefix of the identifiers
+        :param identifiers: An iterable of identifiers
+
+        :returns: A list with the standardized identifier for each identifier, in the same
+            order. If the prefix can't be looked up, the identifiers are returned as is.
+
+        This gives the same results as calling :meth:`Resource.standardize_identifier`
+        on each identifier, but the prefix only gets looked up once.
+
+        >>> from bioregistry import manager
+        >>> manager.standardize_identifiers("chebi", ["CHEBI:1234", "chebi_1234", "1234"])
+        ['1234', '1234', '1234']
+        """
+        resource = self._get_view(prefix)
+        if resource is None:
+            return list(identifiers)
+        strip = resource._get_identifier_stripper().strip
+        return [strip(identifier) for identifier in identifiers]
+
+    def _resolve_prefix(
+        self, prefix: str, *, use_preferred: bool = False
+    ) -> tuple[str, Callable[[str], str]] | None:
+        """Get the normalized prefix (or preferred prefix) and the identifier standardizer."""
+        norm_prefix = self.normalize_prefix(prefix)
+        if norm_prefix is None:
+            return None
+        resource = self.registry[norm_prefix] if self.views is None else self.views[norm_prefix]
+        strip = resource._get_identifier_stripper().strip
+        if use_preferred:
+            return resource.get_preferred_prefix() or norm_prefix, strip
+        return norm_prefix, strip
+
+    def get_mapping_index(self) -> RegistryMappingIndex:
+        """Get the mappings to all external registries, building them in one pass if needed.
+
+        >>> from bioregistry import manager
+        >>> index = manager.get_mapping_index()
+        >>> index.get_map("obofoundry")["go"]
+        'go'
+        >>> index.get_invmap("obofoundry", use_obo_preferred=True)["GO"]
+        'go'
+        """
+        if self._mapping_index is None:
+            self._mapping_index = RegistryMappingIndex.from_registry(
+                self.registry, (self.has_version_mappings, self.provided_by_mappings)
+            )
+        return self._mapping_index
+
     def get_registry_map(
         self, metaprefix: str, *, use_obo_preferred: bool = False
     ) -> dict[str, str]:
         """Get a mapping from the Bioregistry prefixes to prefixes in another registry."""
-        return dict(self._iter_registry_map(metaprefix, use_obo_preferred=use_obo_preferred))
+        return self.get_mapping_index().get_map(metaprefix, use_obo_preferred=use_obo_preferred)
 
-    @cache  # noqa:B019
     def get_registry_invmap(
         self, metaprefix: str, use_obo_preferred: bool = False
     ) -> dict[str, str]:
@@ -804,27 +1371,7 @@ class Manager:
         >>> manager.get_registry_invmap("obofoundry", use_obo_preferred=True)["GO"]
         'go'
         """
-        rv = {
-            external_prefix: prefix
-            for prefix, external_prefix in self._iter_registry_map(
-                metaprefix, use_obo_preferred=use_obo_preferred
-            )
-        }
-        for extras_dict in (self.has_version_mappings, self.provided_by_mappings):
-            for prefix, data in extras_dict.items():
-                for external_prefix in data.get(metaprefix, []):
-                    rv[external_prefix] = prefix
-        return rv
-
-    def _iter_registry_map(
-        self, metaprefix: str, use_obo_preferred: bool = False
-    ) -> Iterable[tuple[str, str]]:
-        for prefix, resource in self.registry.items():
-            mapped_prefix = resource.get_mapped_prefix(
-                metaprefix, use_obo_preferred=use_obo_preferred
-            )
-            if mapped_prefix is not None:
-                yield prefix, mapped_prefix
+        return self.get_mapping_index().get_invmap(metaprefix, use_obo_preferred=use_obo_preferred)
 
     def get_mapped_prefix(
         self, prefix: str, metaprefix: str, *, use_obo_preferred: bool = False
@@ -853,6 +1400,9 @@ class Manager:
 
     def get_uri_format(self, prefix: str, priority: Sequence[str] | None = None) -> str | None:
         """Get the URI format string for the given prefix, if it's available."""
+        if priority is None:
+            view = self._get_view(prefix)
+            return None if view is None else view.get_uri_format()
         entry = self.get_resource(prefix)
         if entry is None:
             return None
@@ -874,6 +1424,13 @@ class Manager:
         self, prefix: str, *, priority: Sequence[str] | None = None, strict: bool = False
     ) -> str | None:
         """Get a well-formed URI prefix, if available."""
+        if priority is None:
+            view = self._get_view(prefix)
+            if view is not None and (uri_prefix := view.get_uri_prefix()) is not None:
+                return uri_prefix
+            if strict:
+                raise ValueError
+            return None
         entry = self.get_resource(prefix)
         if entry is not None:
             return entry.get_uri_prefix(priority=priority, strict=strict)  # type:ignore
@@ -993,7 +1550,7 @@ class Manager:
 
     def get_preferred_prefix(self, prefix: str) -> str | None:
         """Get the preferred prefix (e.g., with stylization) if it exists."""
-        entry = self.get_resource(prefix)
+        entry = self._get_view(prefix)
         if entry is None:
             return None
         return entry.get_preferred_prefix()
@@ -1014,14 +1571,14 @@ class Manager:
 
     def get_pattern(self, prefix: str) -> str | None:
         """Get the pattern for the given prefix, if it's available."""
-        entry = self.get_resource(prefix)
+        entry = self._get_view(prefix)
         if entry is None:
             return None
         return entry.get_pattern()
 
     def get_synonyms(self, prefix: str) -> set[str] | None:
         """Get the synonyms for a given prefix, if available."""
-        entry = self.get_resource(prefix)
+        entry = self._get_view(prefix)
         if entry is None:
             return None
         return entry.get_synonyms()
@@ -1373,9 +1930,10 @@ class Manager:
 
     def _get_obo_list(self, *, prefix: str, resource: Resource, key: str) -> list[str]:
         rv = []
+        invmap = self.get_mapping_index().get_invmap("obofoundry")
         for obo_prefix in resource.get_external("obofoundry").get(key, []):
             # these prefixes are normalized / lowercased already
-            canonical_prefix = self.lookup_from("obofoundry", obo_prefix)
+            canonical_prefix = invmap.get(obo_prefix)
             if canonical_prefix is None:
                 logger.warning("[%s] could not map OBO %s: %s", prefix, key, obo_prefix)
             else:
@@ -1400,7 +1958,7 @@ class Manager:
         >>> manager.lookup_from("obofoundry", "GO", use_obo_preferred=True)
         'go'
         """
-        external_id_to_bioregistry_id = self.get_registry_invmap(
+        external_id_to_bioregistry_id = self.get_mapping_index().get_invmap(
             metaprefix, use_obo_preferred=use_obo_preferred
         )
         return external_id_to_bioregistry_id.get(metaidentifier)
@@ -1504,7 +2062,7 @@ class Manager:
         >>> manager.get_default_iri("chebi", "24867")
         'http://purl.obolibrary.org/obo/CHEBI_24867'
         """
-        entry = self.get_resource(prefix)
+        entry = self._get_view(prefix)
         if entry is None:
             return None
         return entry.get_default_uri(identifier)
@@ -1522,7 +2080,7 @@ class Manager:
         >>> manager.get_rdf_uri("edam", "data_1153")
         'http://edamontology.org/data_1153'
         """
-        entry = self.get_resource(prefix)
+        entry = self._get_view(prefix)
         if entry is None:
             return None
         return entry.get_rdf_uri(identifier)
@@ -1670,7 +2228,7 @@ class Manager:
         >>> manager.get_scholia_iri("pdb", "1234")
         None
         """
-        resource = self.get_resource(prefix)
+        resource = self._get_view(prefix)
         if resource is None:
             return None
         for provider in resource.get_extra_providers():
@@ -1702,7 +2260,7 @@ class Manager:
             if link is not None:
                 rv.append((metaprefix, link))
 
-        resource = self.get_resource(prefix)
+        resource = self._get_view(prefix)
         if resource is None:
             raise KeyError(f"Could not look up a resource by prefix: {prefix}")
         for provider in resource.get_extra_providers(filter_known_inactive=filter_known_inactive):
@@ -1954,7 +2512,7 @@ class Manager:
         >>> manager.is_valid_identifier("xxx", "yyy")
         False
         """
-        resource = self.registry.get(prefix)
+        resource = self.registry.get(prefix) if self.views is None else self.views.get(prefix)
         if resource is None:
             return False
         return resource.is_valid_identifier(identifier)
@@ -1994,7 +2552,7 @@ class Manager:
         >>> manager.is_standardizable_identifier("xxx", "yyy")
         False
         """
-        resource = self.get_resource(prefix)
+        resource = self._get_view(prefix)
         if resource is None:
             return False
         return resource.is_standardizable_identifier(identifier)
@@ -2099,6 +2657,122 @@ class Manager:
             return False
         return self.is_standardizable_identifier(prefix, identifier)
 
+    def validate_identifiers(
+        self, prefixes: Iterable[str], identifiers: Iterable[str], *, standardize: bool = False
+    ) -> BulkValidationResult:
+        """Validate many pairs of prefixes and identifiers.
+
+        :param prefixes: An iterable of prefixes
+        :param identifiers: An iterable of identifiers, in the same order as the prefixes
+        :param standardize: If false, checks the same as :meth:`is_valid_identifier`,
+            i.e., that prefixes are canonical and identifiers don't have bananas. If
+            true, checks the same as :meth:`is_standardizable_identifier`, i.e., that
+            prefixes can be normalized and identifiers match the pattern after
+            removing their banana.
+
+        :returns: A boolean mask that's true for the valid rows, and the number of
+            rows with an invalid prefix or identifier, for each prefix
+
+        Rows are grouped by prefix, so each prefix only gets looked up once and each
+        pattern gets run over all of its identifiers in one loop.
+
+        >>> from bioregistry import manager
+        >>> result = manager.validate_identifiers(
+        ...     ["go", "go", "GO", "xxx"], ["0000001", "0001", "0000001", "yyy"]
+        ... )
+        >>> result.mask.tolist()
+        [True, False, False, False]
+        >>> result.invalid_identifiers
+        Counter({'go': 1})
+        >>> result.invalid_prefixes
+        Counter({'GO': 1, 'xxx': 1})
+        >>> manager.validate_identifiers(
+        ...     ["go", "go", "GO", "xxx"],
+        ...     ["0000001", "0001", "GO:0000001", "yyy"],
+        ...     standardize=True,
+        ... ).mask.tolist()
+        [True, False, True, False]
+        """
+        import numpy as np
+
+        groups: dict[str, list[int]] = {}
+        for i, prefix in enumerate(prefixes):
+            groups.setdefault(prefix, []).append(i)
+        identifiers = list(identifiers)
+        rv = BulkValidationResult(mask=np.zeros(len(identifiers), dtype=bool))
+        self._validate_groups(rv, groups, identifiers, standardize=standardize)
+        return rv
+
+    def validate_curies(
+        self, curies: Iterable[str], *, sep: str = ":", standardize: bool = False
+    ) -> BulkValidationResult:
+        """Validate many CURIEs.
+
+        :param curies: An iterable of CURIEs
+        :param sep: The separator between prefixes and identifiers
+        :param standardize: If false, checks the same as :meth:`is_valid_curie`. If true,
+            checks the same as :meth:`is_standardizable_curie`.
+
+        :returns: A boolean mask that's true for the valid CURIEs, and the number of
+            CURIEs with an invalid prefix or identifier, for each prefix. See
+            :meth:`validate_identifiers`.
+
+        >>> from bioregistry import manager
+        >>> result = manager.validate_curies(["go:0000001", "GO:0000001", "0000001"])
+        >>> result.mask.tolist()
+        [True, False, False]
+        >>> result.malformed
+        1
+        """
+        import numpy as np
+
+        groups: dict[str, list[int]] = {}
+        identifiers = []
+        malformed = 0
+        for i, curie in enumerate(curies):
+            prefix, delimiter, identifier = curie.partition(sep)
+            identifiers.append(identifier)
+            if delimiter:
+                groups.setdefault(prefix, []).append(i)
+            else:
+                malformed += 1
+        rv = BulkValidationResult(mask=np.zeros(len(identifiers), dtype=bool), malformed=malformed)
+        self._validate_groups(rv, groups, identifiers, standardize=standardize)
+        return rv
+
+    def _validate_groups(
+        self,
+        rv: BulkValidationResult,
+        groups: Mapping[str, Sequence[int]],
+        identifiers: Sequence[str],
+        *,
+        standardize: bool,
+    ) -> None:
+        """Fill in the mask and failures for groups of rows with the same prefix."""
+        for prefix, positions in groups.items():
+            if standardize:
+                resource = self._get_view(prefix)
+            elif self.views is None:
+                resource = self.registry.get(prefix)
+            else:
+                resource = self.views.get(prefix)
+            if resource is None:
+                rv.invalid_prefixes[prefix] += len(positions)
+                continue
+            pattern = resource.get_pattern_re()
+            if pattern is None:
+                rv.mask[positions] = True
+                continue
+            fullmatch = pattern.fullmatch
+            if standardize:
+                strip = resource._get_identifier_stripper().strip
+                valid = [fullmatch(strip(identifiers[i])) is not None for i in positions]
+            else:
+                valid = [fullmatch(identifiers[i]) is not None for i in positions]
+            rv.mask[positions] = valid
+            if invalid := len(valid) - sum(valid):
+                rv.invalid_identifiers[resource.prefix] += invalid
+
     def get_context(self, key: str) -> Context | None:
         """Get a prescriptive context.
 
@@ -2289,7 +2963,7 @@ class Manager:
 
 
 def _read_contributors(
-    registry: dict[str, Resource],
+    registry: Mapping[str, Resource],
     metaregistry: dict[str, Registry],
     collections: dict[str, Collection],
     contexts: dict[str, Context],
@@ -2334,5 +3008,47 @@ def _read_contributors(
 
 CUSTOM_RESOLVERS: dict[str, Callable[[str], str | None]] = {"ec": get_ec_url}
 
-#: The default manager for the Bioregistry
-manager = Manager()
+
+class _LazyManager:
+    """A proxy for the default manager that only loads the Bioregistry on first use.
+
+    This makes importing :mod:`bioregistry` cheap for code that only needs
+    constants or the data model. The first attribute lookup (e.g., calling
+    a method) constructs a :class:`Manager`, which all following lookups reuse.
+    """
+
+    _manager: Manager | None = None
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _get_manager(self) -> Manager:
+        """Get the wrapped manager, constructing it if this is the first use."""
+        rv = self._manager
+        if rv is None:
+            with self._lock:
+                rv = self._manager
+                if rv is None:
+                    rv = Manager()
+                    object.__setattr__(self, "_manager", rv)
+        return rv
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._get_manager(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_manager(), name, value)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._get_manager())
+
+    def __repr__(self) -> str:
+        if self._manager is None:
+            return "<lazy bioregistry manager (not loaded)>"
+        return repr(self._manager)
+
+
+#: The default manager for the Bioregistry. This gets loaded on first use.
+manager = cast(Manager, _LazyManager())
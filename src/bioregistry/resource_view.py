@@ -0,0 +1,175 @@
+"""Compact, read-only views over resources for serving."""
+
+from __future__ import annotations
+
+import json
+import re
+import typing
+import zlib
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from .schema import Resource
+from .schema.struct import Provider, _IdentifierStripper
+
+__all__ = [
+    "ResourceView",
+]
+
+
+class ResourceView:
+    """A compact, read-only view of the parts of a resource needed to parse and resolve.
+
+    Views implement the same getters as :class:`Resource` for these parts, so they can
+    be used interchangeably, but they don't keep any of the other curated or external
+    registry data. See :meth:`bioregistry.Manager.freeze`.
+    """
+
+    __slots__ = (
+        "_pattern_re",
+        "_stripper",
+        "banana",
+        "banana_peel",
+        "default_format",
+        "preferred_prefix",
+        "prefix",
+        "providers",
+        "rdf_uri_format",
+        "synonyms",
+        "uri_format",
+        "uri_prefix",
+    )
+
+    prefix: str
+    preferred_prefix: str | None
+    synonyms: frozenset[str]
+    banana: str | None
+    banana_peel: str
+    uri_prefix: str | None
+    uri_format: str | None
+    default_format: str | None
+    rdf_uri_format: str | None
+    providers: tuple[Provider, ...]
+
+    def __init__(self, resource: Resource) -> None:
+        """Resolve the relevant parts of the resource."""
+        self.prefix = resource.prefix
+        self.preferred_prefix = resource.get_preferred_prefix()
+        self.synonyms = frozenset(resource.get_synonyms())
+        pattern = resource.get_pattern()
+        self._pattern_re = None if pattern is None else re.compile(pattern)
+        self.banana = resource.get_banana()
+        self.banana_peel = resource.get_banana_peel()
+        self._stripper = resource._get_identifier_stripper()
+        self.uri_prefix = resource.get_uri_prefix()
+        self.uri_format = resource.get_uri_format()
+        self.default_format = resource.get_default_format()
+        self.rdf_uri_format = resource.get_rdf_uri_format()
+        self.providers = tuple(resource.get_extra_providers())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(prefix={self.prefix!r})"
+
+    def get_preferred_prefix(self) -> str | None:
+        """Get the preferred prefix, see :meth:`Resource.get_preferred_prefix`."""
+        return self.preferred_prefix
+
+    def get_synonyms(self) -> set[str]:
+        """Get synonyms, see :meth:`Resource.get_synonyms`."""
+        return set(self.synonyms)
+
+    def get_pattern(self) -> str | None:
+        """Get the pattern, see :meth:`Resource.get_pattern`."""
+        return None if self._pattern_re is None else self._pattern_re.pattern
+
+    def get_pattern_re(self) -> typing.Pattern[str] | None:
+        """Get the compiled pattern, see :meth:`Resource.get_pattern_re`."""
+        return self._pattern_re
+
+    def get_banana(self) -> str | None:
+        """Get the banana, see :meth:`Resource.get_banana`."""
+        return self.banana
+
+    def get_banana_peel(self) -> str:
+        """Get the banana peel, see :meth:`Resource.get_banana_peel`."""
+        return self.banana_peel
+
+    def get_uri_prefix(self) -> str | None:
+        """Get the URI prefix, see :meth:`Resource.get_uri_prefix`."""
+        return self.uri_prefix
+
+    def get_uri_format(self) -> str | None:
+        """Get the URI format, see :meth:`Resource.get_uri_format`."""
+        return self.uri_format
+
+    def get_default_format(self) -> str | None:
+        """Get the first-party URI format, see :meth:`Resource.get_default_format`."""
+        return self.default_format
+
+    def get_default_uri(self, identifier: str) -> str | None:
+        """Get the first-party URI, see :meth:`Resource.get_default_uri`."""
+        if self.default_format is None:
+            return None
+        return self.default_format.replace("$1", identifier)
+
+    def get_rdf_uri_format(self) -> str | None:
+        """Get the RDF URI format, see :meth:`Resource.get_rdf_uri_format`."""
+        return self.rdf_uri_format
+
+    def get_rdf_uri(self, identifier: str) -> str | None:
+        """Get the RDF URI, see :meth:`Resource.get_rdf_uri`."""
+        if self.rdf_uri_format is None:
+            return None
+        return self.rdf_uri_format.replace("$1", identifier)
+
+    def get_extra_providers(self, *, filter_known_inactive: bool = False) -> list[Provider]:
+        """Get extra providers, see :meth:`Resource.get_extra_providers`."""
+        if filter_known_inactive:
+            return [provider for provider in self.providers if not provider.is_known_inactive()]
+        return list(self.providers)
+
+    def standardize_identifier(self, identifier: str) -> str:
+        """Standardize an identifier, see :meth:`Resource.standardize_identifier`."""
+        return self._stripper.strip(identifier)
+
+    def _get_identifier_stripper(self) -> _IdentifierStripper:
+        """Get the precompiled leads for :meth:`standardize_identifier`."""
+        return self._stripper
+
+    def is_valid_identifier(self, identifier: str) -> bool:
+        """Check an identifier, see :meth:`Resource.is_valid_identifier`."""
+        if self._pattern_re is None:
+            return True
+        return self._pattern_re.fullmatch(identifier) is not None
+
+    def is_standardizable_identifier(self, identifier: str) -> bool:
+        """Check an identifier, see :meth:`Resource.is_standardizable_identifier`."""
+        return self.is_valid_identifier(self.standardize_identifier(identifier))
+
+
+class _CompressedRecords(Mapping[str, Mapping[str, Any]]):
+    """A mapping from prefixes to records of resources, kept compressed in memory."""
+
+    def __init__(self, resources: Mapping[str, Resource]) -> None:
+        """Compress the resources."""
+        self._data = {
+            prefix: zlib.compress(resource.model_dump_json(exclude_none=True).encode("utf-8"))
+            for prefix, resource in resources.items()
+        }
+
+    def __getitem__(self, prefix: str) -> Mapping[str, Any]:
+        """Decompress the record for the given prefix."""
+        rv: Mapping[str, Any] = json.loads(zlib.decompress(self._data[prefix]))
+        return rv
+
+    def __contains__(self, prefix: object) -> bool:
+        """Check if there's a record for the prefix, without decompressing it."""
+        return prefix in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over prefixes."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Count the records."""
+        return len(self._data)
@@ -0,0 +1,421 @@
+"""Match identifiers against patterns without catastrophic backtracking.
+
+Most identifier patterns can safely be run with :mod:`re`, but some patterns have an
+unbounded repeat nested in another one that can match the same characters, e.g.,
+``^(/[a-z][a-z/]+)*$``. Python's backtracking engine takes exponential time to reject
+identifiers like ``/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa/aa!`` with
+such patterns. These risky patterns are found by looking at the parsed pattern, and are
+instead run with a non-backtracking engine that simulates all paths through the pattern
+at once, so it takes linear time in the length of the identifier.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from re import _constants as sre_constants  # type:ignore[attr-defined]
+from re import _parser as sre_parse  # type:ignore[attr-defined]
+from typing import Any
+
+__all__ = [
+    "MAX_RISKY_IDENTIFIER_LENGTH",
+    "SafePattern",
+    "UnsupportedPatternError",
+    "get_identifier_matcher",
+    "is_risky_pattern",
+]
+
+#: Identifiers longer than this are rejected without matching if their pattern is
+#: risky and can't be run with :class:`SafePattern`, e.g., since it has backreferences
+MAX_RISKY_IDENTIFIER_LENGTH = 64
+
+#: The maximum number of states in a :class:`SafePattern`, since bounded repeats like
+#: ``{1,100}`` get expanded
+MAX_STATES = 5_000
+
+#: The maximum number of cached transitions in a :class:`SafePattern`
+MAX_CACHE_SIZE = 100_000
+
+_MAXREPEAT = sre_constants.MAXREPEAT
+_REPEATS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+_BEGINNINGS = {sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING}
+_ENDS = {sre_constants.AT_END, sre_constants.AT_END_STRING}
+#: The number of characters in a range after which it's treated like a wildcard
+_MAX_RANGE = 256
+
+
+class UnsupportedPatternError(ValueError):
+    """Raised when a pattern uses features that :class:`SafePattern` doesn't support."""
+
+
+@dataclass
+class _CharSet:
+    """An approximation of the characters matched at some position in a pattern."""
+
+    chars: set[str] = field(default_factory=set)
+    #: If the set contains characters that aren't listed, e.g., for ``.`` or ``\\S``
+    wild: bool = False
+
+    def __bool__(self) -> bool:
+        return self.wild or bool(self.chars)
+
+    def update(self, other: _CharSet) -> None:
+        self.chars.update(other.chars)
+        self.wild = self.wild or other.wild
+
+    def overlaps(self, other: _CharSet) -> bool:
+        if self.wild and other or other.wild and self:
+            return True
+        return not self.chars.isdisjoint(other.chars)
+
+
+def _get_node_chars(op: Any, av: Any) -> _CharSet:
+    """Get the characters a single-character node can match."""
+    if op is sre_constants.LITERAL:
+        return _CharSet({chr(av)})
+    if op is sre_constants.IN:
+        rv = _CharSet()
+        for item_op, item_av in av:
+            if item_op is sre_constants.LITERAL:
+                rv.chars.add(chr(item_av))
+            elif item_op is sre_constants.RANGE and item_av[1] - item_av[0] < _MAX_RANGE:
+                rv.chars.update(map(chr, range(item_av[0], item_av[1] + 1)))
+            else:  # categories, negations, and big ranges
+                rv.wild = True
+        return rv
+    return _CharSet(wild=True)  # ANY, NOT_LITERAL, and anything else
+
+
+def _is_nullable(items: Iterable[tuple[Any, Any]]) -> bool:
+    """Check if a sequence of parsed nodes can match the empty string."""
+    return all(_is_node_nullable(op, av) for op, av in items)
+
+
+def _is_node_nullable(op: Any, av: Any) -> bool:
+    if op in _REPEATS:
+        return av[0] == 0 or _is_nullable(av[2])
+    if op is sre_constants.SUBPATTERN:
+        return _is_nullable(av[-1])
+    if op is sre_constants.BRANCH:
+        return any(_is_nullable(branch) for branch in av[1])
+    return op in {sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT}
+
+
+def _get_first_chars(items: Iterable[tuple[Any, Any]]) -> _CharSet:
+    """Get the characters that a sequence of parsed nodes can start with."""
+    rv = _CharSet()
+    for op, av in items:
+        if op in _REPEATS:
+            rv.update(_get_first_chars(av[2]))
+        elif op is sre_constants.SUBPATTERN:
+            rv.update(_get_first_chars(av[-1]))
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                rv.update(_get_first_chars(branch))
+        elif op not in {sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT}:
+            rv.update(_get_node_chars(op, av))
+        if not _is_node_nullable(op, av):
+            break
+    return rv
+
+
+def _iter_repeats(items: Iterable[tuple[Any, Any]]) -> Iterable[tuple[Any, Any]]:
+    """Iterate over the unbounded repeats in a sequence of parsed nodes, recursively."""
+    for op, av in items:
+        if op in _REPEATS:
+            if av[1] == _MAXREPEAT:
+                yield op, av
+            yield from _iter_repeats(av[2])
+        elif op is sre_constants.SUBPATTERN:
+            yield from _iter_repeats(av[-1])
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                yield from _iter_repeats(branch)
+        elif op in {sre_constants.ASSERT, sre_constants.ASSERT_NOT}:
+            yield from _iter_repeats(av[1])
+
+
+def _iter_branches(items: Iterable[tuple[Any, Any]]) -> Iterable[list[Any]]:
+    """Iterate over the alternatives of the branches in a sequence of nodes, recursively."""
+    for op, av in items:
+        if op in _REPEATS:
+            yield from _iter_branches(av[2])
+        elif op is sre_constants.SUBPATTERN:
+            yield from _iter_branches(av[-1])
+        elif op is sre_constants.BRANCH:
+            yield av[1]
+            for branch in av[1]:
+                yield from _iter_branches(branch)
+
+
+def _get_chars(items: Iterable[tuple[Any, Any]]) -> _CharSet:
+    """Get all characters that a sequence of parsed nodes can match anywhere."""
+    rv = _CharSet()
+    for op, av in items:
+        if op in _REPEATS:
+            rv.update(_get_chars(av[2]))
+        elif op is sre_constants.SUBPATTERN:
+            rv.update(_get_chars(av[-1]))
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                rv.update(_get_chars(branch))
+        elif op not in {sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT}:
+            rv.update(_get_node_chars(op, av))
+    return rv
+
+
+def is_risky_pattern(pattern: str) -> bool:
+    """Check if a pattern could take exponential time to match with :mod:`re`.
+
+    :param pattern: A regular expression
+
+    :returns: If the pattern has an unbounded repeat whose body either contains another
+        unbounded repeat that can match the characters the body starts with, or has
+        alternatives that can start with the same characters. Then, there are
+        exponentially many ways to split up an identifier between the repeats, which
+        the backtracking engine tries one at a time before giving up.
+
+    >>> is_risky_pattern("^GO:[0-9]{7}$")
+    False
+    >>> is_risky_pattern("^[a-z]+(-[a-z]+)*$")
+    False
+    >>> is_risky_pattern("^(/[a-z][a-z/]+)*$")
+    True
+    >>> is_risky_pattern("^(ab|a[a-z])+$")
+    True
+    """
+    parsed = sre_parse.parse(pattern)
+    for _, (_, _, body) in _iter_repeats(parsed):
+        first = _get_first_chars(body)
+        for _, (_, _, inner_body) in _iter_repeats(body):
+            if _get_chars(inner_body).overlaps(first):
+                return True
+        for alternatives in _iter_branches(body):
+            firsts = [_get_first_chars(alternative) for alternative in alternatives]
+            for i, left in enumerate(firsts):
+                if any(left.overlaps(right) for right in firsts[i + 1 :]):
+                    return True
+    return False
+
+
+def _get_predicate(op: Any, av: Any) -> Callable[[str], bool]:
+    """Get a function that checks if a character matches a single-character node."""
+    if op is sre_constants.LITERAL:
+        char = chr(av)
+        return lambda c: c == char
+    if op is sre_constants.NOT_LITERAL:
+        char = chr(av)
+        return lambda c: c != char
+    if op is sre_constants.ANY:
+        return lambda c: c != "\n"
+    if op is not sre_constants.IN:
+        raise UnsupportedPatternError(op)
+    chars: set[str] = set()
+    ranges: list[tuple[int, int]] = []
+    categories: list[Callable[[str], bool]] = []
+    negate = False
+    for item_op, item_av in av:
+        if item_op is sre_constants.NEGATE:
+            negate = True
+        elif item_op is sre_constants.LITERAL:
+            chars.add(chr(item_av))
+        elif item_op is sre_constants.RANGE:
+            ranges.append(item_av)
+        elif item_op is sre_constants.CATEGORY:
+            categories.append(_CATEGORIES[item_av])
+        else:
+            raise UnsupportedPatternError(item_op)
+
+    def _predicate(c: str) -> bool:
+        rv = (
+            c in chars
+            or any(low <= ord(c) <= high for low, high in ranges)
+            or any(category(c) for category in categories)
+        )
+        return rv is not negate
+
+    return _predicate
+
+
+def _is_word(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+_CATEGORIES: dict[Any, Callable[[str], bool]] = {
+    sre_constants.CATEGORY_DIGIT: str.isdecimal,
+    sre_constants.CATEGORY_NOT_DIGIT: lambda c: not c.isdecimal(),
+    sre_constants.CATEGORY_SPACE: str.isspace,
+    sre_constants.CATEGORY_NOT_SPACE: lambda c: not c.isspace(),
+    sre_constants.CATEGORY_WORD: _is_word,
+    sre_constants.CATEGORY_NOT_WORD: lambda c: not _is_word(c),
+}
+
+#: The kinds of states in a :class:`SafePattern`
+_CHAR, _SPLIT, _BEGIN, _END, _MATCH = range(5)
+
+
+class SafePattern:
+    """A pattern that's matched without backtracking.
+
+    The pattern is compiled into a nondeterministic finite automaton, and matching
+    follows all of its states at once. The sets of states reached for each character
+    are cached, so matching many identifiers against the same pattern is fast after
+    the first few.
+
+    >>> pattern = SafePattern("^(/[a-z][a-z/]+)*$")
+    >>> pattern.fullmatch("/ab/cd")
+    True
+    >>> pattern.fullmatch("/aa" * 100 + "!")
+    False
+    """
+
+    def __init__(self, pattern: str) -> None:
+        """Compile the pattern.
+
+        :param pattern: A regular expression
+
+        :raises UnsupportedPatternError: If the pattern uses flags, backreferences,
+            lookarounds, or other features that can't be matched by a finite
+            automaton, or is too big
+        """
+        self.pattern = pattern
+        parsed = sre_parse.parse(pattern)
+        if parsed.state.flags & ~(re.UNICODE | re.NOFLAG):
+            raise UnsupportedPatternError("flags")
+        self._kinds: list[int] = []
+        self._args: list[Any] = []
+        match = self._add(_MATCH, None)
+        self._start = self._compile(parsed, match)
+        self._closures: dict[tuple[frozenset[int], bool, bool], frozenset[int]] = {}
+        self._steps: dict[tuple[frozenset[int], str], frozenset[int]] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.pattern!r})"
+
+    def _add(self, kind: int, args: Any) -> int:
+        if len(self._kinds) >= MAX_STATES:
+            raise UnsupportedPatternError("too many states")
+        self._kinds.append(kind)
+        self._args.append(args)
+        return len(self._kinds) - 1
+
+    def _compile(self, items: Iterable[tuple[Any, Any]], following: int) -> int:
+        """Compile a sequence of parsed nodes, whose match continues at another state."""
+        for op, av in reversed(list(items)):
+            following = self._compile_node(op, av, following)
+        return following
+
+    def _compile_node(self, op: Any, av: Any, following: int) -> int:
+        if op is sre_constants.SUBPATTERN:
+            _group, add_flags, del_flags, items = av
+            if add_flags or del_flags:
+                raise UnsupportedPatternError("flags")
+            return self._compile(items, following)
+        if op is sre_constants.BRANCH:
+            return self._add(
+                _SPLIT, tuple(self._compile(branch, following) for branch in av[1])
+            )
+        if op in _REPEATS:
+            low, high, items = av
+            if high == _MAXREPEAT:
+                loop = self._add(_SPLIT, None)
+                self._args[loop] = (self._compile(items, loop), following)
+                state = loop
+            else:
+                state = following
+                for _ in range(high - low):
+                    state = self._add(_SPLIT, (self._compile(items, state), following))
+            for _ in range(low):
+                state = self._compile(items, state)
+            return state
+        if op is sre_constants.AT:
+            if av in _BEGINNINGS:
+                return self._add(_BEGIN, following)
+            if av in _ENDS:
+                return self._add(_END, following)
+            raise UnsupportedPatternError(av)
+        return self._add(_CHAR, (_get_predicate(op, av), following))
+
+    def _close(self, states: frozenset[int], begin: bool, end: bool) -> frozenset[int]:
+        """Follow all states that don't consume characters."""
+        key = states, begin, end
+        rv = self._closures.get(key)
+        if rv is not None:
+            return rv
+        seen = set()
+        stack = list(states)
+        closed = set()
+        while stack:
+            state = stack.pop()
+            if state in seen:
+                continue
+            seen.add(state)
+            kind = self._kinds[state]
+            if kind == _SPLIT:
+                stack.extend(self._args[state])
+            elif kind == _BEGIN:
+                if begin:
+                    stack.append(self._args[state])
+            elif kind == _END:
+                if end:
+                    stack.append(self._args[state])
+            else:
+                closed.add(state)
+        if len(self._closures) >= MAX_CACHE_SIZE:
+            self._closures.clear()
+        rv = self._closures[key] = frozenset(closed)
+        return rv
+
+    def _step(self, states: frozenset[int], char: str) -> frozenset[int]:
+        """Get the states reached by consuming a character, before following the others."""
+        key = states, char
+        rv = self._steps.get(key)
+        if rv is not None:
+            return rv
+        targets = set()
+        for state in states:
+            if self._kinds[state] == _CHAR:
+                predicate, following = self._args[state]
+                if predicate(char):
+                    targets.add(following)
+        if len(self._steps) >= MAX_CACHE_SIZE:
+            self._steps.clear()
+        rv = self._steps[key] = frozenset(targets)
+        return rv
+
+    def fullmatch(self, string: str) -> bool:
+        """Check if the pattern matches the whole string."""
+        states = self._close(frozenset([self._start]), True, not string)
+        last = len(string) - 1
+        for i, char in enumerate(string):
+            states = self._close(self._step(states, char), False, i == last)
+            if not states:
+                return False
+        return 0 in states  # the match state is the first one that gets added
+
+
+def get_identifier_matcher(pattern: str | re.Pattern[str]) -> Callable[[str], bool]:
+    """Get a function that checks if an identifier fully matches a pattern.
+
+    :param pattern: A regular expression, or a compiled one
+
+    :returns: A function that checks identifiers with :mod:`re` for most patterns,
+        and with a :class:`SafePattern` for risky ones (see :func:`is_risky_pattern`).
+        If a risky pattern can't be run as a :class:`SafePattern`, identifiers longer
+        than :data:`MAX_RISKY_IDENTIFIER_LENGTH` are rejected.
+
+    >>> matcher = get_identifier_matcher("^(/[a-z][a-z/]+)*$")
+    >>> matcher("/ab/cd"), matcher("/aa" * 100 + "!")
+    (True, False)
+    """
+    compiled = re.compile(pattern) if isinstance(pattern, str) else pattern
+    fullmatch = compiled.fullmatch
+    if not is_risky_pattern(compiled.pattern):
+        return lambda identifier: fullmatch(identifier) is not None
+    try:
+        return SafePattern(compiled.pattern).fullmatch
+    except UnsupportedPatternError:
+        return lambda identifier: (
+            len(identifier) <= MAX_RISKY_IDENTIFIER_LENGTH and fullmatch(identifier) is not None
+        )
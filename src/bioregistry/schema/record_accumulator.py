@@ -12,6 +12,7 @@ from curies.w3c import NCNAME_RE
 from .struct import Resource
 
 __all__ = [
+    "add_resource",
     "get_converter",
 ]
 
@@ -95,7 +96,7 @@ def _stratify_resources(
     # TODO only call it as secondary if it has an overlap with the primary
 
     for resource in resources:
-        primary_prefix = resource.provides or resource.has_canonical or resource.part_of
+        primary_prefix = _get_primary_prefix(resource)
         if primary_prefix is not None:
             # TODO there's some nuance to the order here, make resource.part_of the last.
             secondary_resources.append((resource, primary_prefix))
@@ -104,6 +105,10 @@ def _stratify_resources(
     return primary_resources, secondary_resources
 
 
+def _get_primary_prefix(resource: Resource) -> str | None:
+    return resource.provides or resource.has_canonical or resource.part_of
+
+
 def _iterate_prefix_prefix(resource: Resource, *extras: str) -> Iterable[str]:
     prefixes_ = [
         resource.prefix,
@@ -181,53 +186,135 @@ def _get_converter(
     primary_resources, secondary_resources = _stratify_resources(resources)
 
     for resource in primary_resources:
-        primary_uri_prefix, secondary_uri_prefixes = _get_uri_prefixes(
-            resource, uri_prefix_priority, enforce_w3c=enforce_w3c, stubs=stubs
+        _add_primary_resource(
+            converter,
+            resource,
+            prefix_priority=prefix_priority,
+            uri_prefix_priority=uri_prefix_priority,
+            include_prefixes=include_prefixes,
+            enforce_w3c=enforce_w3c,
+            stubs=stubs,
         )
-        if primary_uri_prefix is None:
-            continue
-        primary_prefix, secondary_prefixes = _get_curie_prefixes(resource, prefix_priority)
-        converter.add_prefix(
+
+    for resource, primary_prefix in secondary_resources:
+        _add_secondary_resource(
+            converter,
+            resource,
             primary_prefix,
-            primary_uri_prefix,
-            secondary_prefixes,
-            secondary_uri_prefixes,
-            pattern=resource.get_pattern(),
-            merge=False,
+            prefix_priority=prefix_priority,
+            uri_prefix_priority=uri_prefix_priority,
+            include_prefixes=include_prefixes,
+            enforce_w3c=enforce_w3c,
+            stubs=stubs,
         )
-        if include_prefixes:
-            converter.add_uri_prefix_synonym(primary_prefix, f"{primary_prefix}:")
-            converter.add_uri_prefix_synonym(primary_prefix, f"{primary_prefix.upper()}:")
-            converter.add_uri_prefix_synonym(primary_prefix, f"{primary_prefix.lower()}:")
-            for secondary_prefix in secondary_prefixes:
-                converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix}:")
-                converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix.upper()}:")
-                converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix.lower()}:")
 
-    for resource, primary_prefix in secondary_resources:
-        secondary_uri_prefix, secondary_uri_prefixes = _get_uri_prefixes(
-            resource, uri_prefix_priority, enforce_w3c=enforce_w3c, stubs=stubs
+    return converter
+
+
+def add_resource(
+    converter: Converter,
+    resource: Resource,
+    prefix_priority: Sequence[str] | None = None,
+    uri_prefix_priority: Sequence[str] | None = None,
+    include_prefixes: bool = False,
+    enforce_w3c: bool = False,
+    stubs: bool = False,
+) -> None:
+    """Add a resource to a converter, in the same way as :func:`get_converter`.
+
+    Resources that provide for, are part of, or have a canonical resource get added as
+    synonyms to that resource's record, which must already be in the converter.
+    """
+    if resource.prefix in prefix_blacklist:
+        return
+    primary_prefix = _get_primary_prefix(resource)
+    if primary_prefix is None:
+        _add_primary_resource(
+            converter,
+            resource,
+            prefix_priority=prefix_priority,
+            uri_prefix_priority=uri_prefix_priority,
+            include_prefixes=include_prefixes,
+            enforce_w3c=enforce_w3c,
+            stubs=stubs,
+        )
+    else:
+        _add_secondary_resource(
+            converter,
+            resource,
+            primary_prefix,
+            prefix_priority=prefix_priority,
+            uri_prefix_priority=uri_prefix_priority,
+            include_prefixes=include_prefixes,
+            enforce_w3c=enforce_w3c,
+            stubs=stubs,
         )
-        if secondary_uri_prefix:
-            converter.add_uri_prefix_synonym(primary_prefix, secondary_uri_prefix)
-            for s in secondary_uri_prefixes:
-                converter.add_uri_prefix_synonym(primary_prefix, s)
 
-        secondary_prefix, tertiary_prefixes = _get_curie_prefixes(resource, prefix_priority)
-        converter.add_prefix_synonym(primary_prefix, secondary_prefix)
-        for s in tertiary_prefixes:
-            converter.add_prefix_synonym(primary_prefix, s)
 
-        if include_prefixes:
+def _add_primary_resource(
+    converter: Converter,
+    resource: Resource,
+    prefix_priority: Sequence[str] | None,
+    uri_prefix_priority: Sequence[str] | None,
+    include_prefixes: bool,
+    enforce_w3c: bool,
+    stubs: bool,
+) -> None:
+    primary_uri_prefix, secondary_uri_prefixes = _get_uri_prefixes(
+        resource, uri_prefix_priority, enforce_w3c=enforce_w3c, stubs=stubs
+    )
+    if primary_uri_prefix is None:
+        return
+    primary_prefix, secondary_prefixes = _get_curie_prefixes(resource, prefix_priority)
+    converter.add_prefix(
+        primary_prefix,
+        primary_uri_prefix,
+        secondary_prefixes,
+        secondary_uri_prefixes,
+        pattern=resource.get_pattern(),
+        merge=False,
+    )
+    if include_prefixes:
+        converter.add_uri_prefix_synonym(primary_prefix, f"{primary_prefix}:")
+        converter.add_uri_prefix_synonym(primary_prefix, f"{primary_prefix.upper()}:")
+        converter.add_uri_prefix_synonym(primary_prefix, f"{primary_prefix.lower()}:")
+        for secondary_prefix in secondary_prefixes:
             converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix}:")
             converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix.upper()}:")
             converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix.lower()}:")
-            for tertiary_prefix in tertiary_prefixes:
-                converter.add_uri_prefix_synonym(primary_prefix, f"{tertiary_prefix}:")
-                converter.add_uri_prefix_synonym(primary_prefix, f"{tertiary_prefix.upper()}:")
-                converter.add_uri_prefix_synonym(primary_prefix, f"{tertiary_prefix.lower()}:")
 
-    return converter
+
+def _add_secondary_resource(
+    converter: Converter,
+    resource: Resource,
+    primary_prefix: str,
+    prefix_priority: Sequence[str] | None,
+    uri_prefix_priority: Sequence[str] | None,
+    include_prefixes: bool,
+    enforce_w3c: bool,
+    stubs: bool,
+) -> None:
+    secondary_uri_prefix, secondary_uri_prefixes = _get_uri_prefixes(
+        resource, uri_prefix_priority, enforce_w3c=enforce_w3c, stubs=stubs
+    )
+    if secondary_uri_prefix:
+        converter.add_uri_prefix_synonym(primary_prefix, secondary_uri_prefix)
+        for s in secondary_uri_prefixes:
+            converter.add_uri_prefix_synonym(primary_prefix, s)
+
+    secondary_prefix, tertiary_prefixes = _get_curie_prefixes(resource, prefix_priority)
+    converter.add_prefix_synonym(primary_prefix, secondary_prefix)
+    for s in tertiary_prefixes:
+        converter.add_prefix_synonym(primary_prefix, s)
+
+    if include_prefixes:
+        converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix}:")
+        converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix.upper()}:")
+        converter.add_uri_prefix_synonym(primary_prefix, f"{secondary_prefix.lower()}:")
+        for tertiary_prefix in tertiary_prefixes:
+            converter.add_uri_prefix_synonym(primary_prefix, f"{tertiary_prefix}:")
+            converter.add_uri_prefix_synonym(primary_prefix, f"{tertiary_prefix.upper()}:")
+            converter.add_uri_prefix_synonym(primary_prefix, f"{tertiary_prefix.lower()}:")
 
 
 def _get_curie_prefixes(
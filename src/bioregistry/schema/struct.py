@@ -872,12 +872,46 @@ class Resource(BaseModel):
     #: External data from BiodivPortal
     biodivportal: Mapping[str, Any] | None = Field(default=None)
 
-    # Cached compiled pattern for identifiers
-    _compiled_pattern: re.Pattern[str] | None = PrivateAttr(None)
+    # Cached values for getters that merge curated and external data. These
+    # are resolved lazily, once per resource, and dropped on any assignment
+    _resolved: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """Set an attribute on the resource and invalidate resolved fields."""
+        super().__setattr__(key, value)
+        if not key.startswith("_"):
+            self.clear_resolved()
+
+    def __eq__(self, other: object) -> bool:
+        # resolved fields are a cache, so they don't take part in comparison
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def clear_resolved(self) -> None:
+        """Clear the cache of resolved fields.
+
+        This is done automatically when a field is assigned, but needs to be called
+        explicitly if a mutable field (e.g., the ``synonyms`` list or one of the
+        external registry dictionaries) is modified in place.
+        """
+        self._resolved = {}
+
+    def _get_resolved(self, key: str, func: Callable[[], X]) -> X:
+        """Get a resolved field, calculating it with the function if not already cached."""
+        # reading private attributes through pydantic's __getattr__ is slow
+        resolved: dict[str, Any] = self.__pydantic_private__["_resolved"]  # type:ignore[index]
+        try:
+            return cast(X, resolved[key])
+        except KeyError:
+            rv = resolved[key] = func()
+            return rv
 
     def get_external(self, metaprefix: str) -> Mapping[str, Any]:
         """Get an external registry."""
-        return self.model_dump().get(metaprefix) or {}
+        if metaprefix not in type(self).model_fields:
+            return {}
+        return getattr(self, metaprefix) or {}
 
     def get_mapped_prefix(self, metaprefix: str, use_obo_preferred: bool = True) -> str | None:
         """Get the prefix for the given external.
@@ -933,7 +967,7 @@ class Resource(BaseModel):
         provenance: bool = False,
     ) -> X | MetaprefixAnnotatedValue[X] | None:
         """Get a key enriched by the given external resources' data."""
-        rv = self.model_dump().get(key)
+        rv = getattr(self, key) if key in type(self).model_fields else None
         if rv is not None:
             if isinstance(rv, str):
                 rv = rv.replace("\r\n", "\n")
@@ -1041,7 +1075,7 @@ class Resource(BaseModel):
         return fmt.replace("$1", identifier)
 
     def __setitem__(self, key: str, value: Any) -> None:
-        """Set an attribute on the resource."""
+        """Set an attribute on the resource and invalidate resolved fields."""
         setattr(self, key, value)
 
     def get_banana(self) -> str | None:
@@ -1083,6 +1117,9 @@ class Resource(BaseModel):
         >>> get_resource("ncbitaxon").get_banana()
         None
         """
+        return self._get_resolved("banana", self._resolve_banana)
+
+    def _resolve_banana(self) -> str | None:
         if self.banana is not None:
             return self.banana
         if self.get_namespace_in_lui(provenance=False) is False:
@@ -1108,6 +1145,9 @@ class Resource(BaseModel):
         >>> get_resource("go").get_default_format()
         'http://purl.obolibrary.org/obo/GO_$1'
         """
+        return self._get_resolved("default_format", self._resolve_default_format)
+
+    def _resolve_default_format(self) -> str | None:
         if self.uri_format is not None:
             return self.uri_format
         for metaprefix, key in URI_FORMAT_PATHS:
@@ -1147,6 +1187,9 @@ class Resource(BaseModel):
         >>> get_resource("dpo").get_preferred_prefix()
         'DPO'
         """
+        return self._get_resolved("preferred_prefix", self._resolve_preferred_prefix)
+
+    def _resolve_preferred_prefix(self) -> str | None:
         if self.preferred_prefix is not None:
             return self.preferred_prefix
         obo_preferred_prefix = self.get_obo_preferred_prefix()
@@ -1221,7 +1264,10 @@ class Resource(BaseModel):
         if provenance:
             rv = self._get_prefix_key_str("name", DEFAULT_METAPREFIX_PRIORITY, provenance=True)
         else:
-            rv = self._get_prefix_key_str("name", DEFAULT_METAPREFIX_PRIORITY, provenance=False)  # type:ignore
+            rv = self._get_resolved(  # type:ignore
+                "name",
+                lambda: self._get_prefix_key_str("name", DEFAULT_METAPREFIX_PRIORITY),
+            )
         if rv is not None:
             return rv
         if strict:
@@ -1235,6 +1281,9 @@ class Resource(BaseModel):
             from markdown import markdown
 
             return markupsafe.Markup(markdown(self.description))
+        return self._get_resolved("description", self._resolve_description)
+
+    def _resolve_description(self) -> str | None:
         metaprefixes: Sequence[str] = (
             "miriam",
             "n2t",
@@ -1274,6 +1323,9 @@ class Resource(BaseModel):
             3. Wikidata
             4. BARTOC
         """
+        return self._get_resolved("pattern", self._resolve_pattern)
+
+    def _resolve_pattern(self) -> str | None:
         if self.pattern is not None:
             return self.pattern
         rv = self._get_prefix_key_str("pattern", ("miriam", "wikidata", "bartoc"))
@@ -1283,13 +1335,13 @@ class Resource(BaseModel):
 
     def get_pattern_re(self) -> typing.Pattern[str] | None:
         """Get the compiled pattern for the given prefix, if it's available."""
-        if self._compiled_pattern:
-            return self._compiled_pattern
+        return self._get_resolved("pattern_re", self._compile_pattern)
+
+    def _compile_pattern(self) -> typing.Pattern[str] | None:
         pattern = self.get_pattern()
         if pattern is None:
             return None
-        self._compiled_pattern = re.compile(pattern)
-        return self._compiled_pattern
+        return re.compile(pattern)
 
     def get_pattern_with_banana(self, strict: bool = True) -> str | None:
         r"""Get the pattern for the prefix including a banana if available.
@@ -1385,16 +1437,23 @@ class Resource(BaseModel):
         """Check if the namespace should appear in the LUI."""
         if self.namespace_in_lui is not None:
             return self.namespace_in_lui
-        if miriam := self.get_external("miriam"):
-            rv = miriam["extras"][MIRIAM_NAMESPACE_IN_LUI]
-            if provenance:
+        if provenance:
+            if miriam := self.get_external("miriam"):
+                rv = miriam["extras"][MIRIAM_NAMESPACE_IN_LUI]
                 return MetaprefixAnnotatedValue[bool](value=rv, metaprefix="miriam")
-            return cast(bool, rv)
+            return False
+        return self._get_resolved("namespace_in_lui", self._resolve_namespace_in_lui)
+
+    def _resolve_namespace_in_lui(self) -> bool:
+        if miriam := self.get_external("miriam"):
+            return cast(bool, miriam["extras"][MIRIAM_NAMESPACE_IN_LUI])
         return False
 
     def get_homepage(self) -> str | None:
         """Return the homepage, if available."""
-        return self._get_prefix_key_str("homepage", DEFAULT_METAPREFIX_PRIORITY)
+        return self._get_resolved(
+            "homepage", lambda: self._get_prefix_key_str("homepage", DEFAULT_METAPREFIX_PRIORITY)
+        )
 
     def get_domain(self) -> str | None:
         """Get the domain."""
@@ -1602,6 +1661,9 @@ class Resource(BaseModel):
         >>> assert get_resource("iro").is_deprecated()  # marked by Bioregistry
         >>> assert get_resource("miriam.collection").is_deprecated()  # marked by MIRIAM
         """
+        return self._get_resolved("deprecated", self._resolve_deprecated)
+
+    def _resolve_deprecated(self) -> bool:
         if self.deprecated is not None:
             return self.deprecated
         for key in DEFAULT_METAPREFIX_PRIORITY:
@@ -2003,6 +2065,9 @@ class Resource(BaseModel):
 
     def get_rdf_uri_format(self) -> str | None:
         """Get the URI format string for the given prefix for RDF usages."""
+        return self._get_resolved("rdf_uri_format", self._resolve_rdf_uri_format)
+
+    def _resolve_rdf_uri_format(self) -> str | None:
         if self.rdf_uri_format:
             return self.rdf_uri_format
         if self.obofoundry:
@@ -2129,6 +2194,11 @@ class Resource(BaseModel):
         >>> get_resource("chebi").get_uri_format(priority=priority)
         'http://purl.obolibrary.org/obo/CHEBI_$1'
         """
+        if priority is None:
+            return self._get_resolved("uri_format", self._resolve_uri_format)
+        return self._resolve_uri_format(priority)
+
+    def _resolve_uri_format(self, priority: Sequence[str] | None = None) -> str | None:
         for uri_format in self._iterate_uri_formats(priority):
             return uri_format
         return None
@@ -2189,10 +2259,12 @@ class Resource(BaseModel):
         >>> bioregistry.get_uri_prefix("chebi")
         'http://purl.obolibrary.org/obo/CHEBI_'
         """
-        for uri_format in self._iterate_uri_formats(priority):
-            uri_prefix = self._clip_uri_format(uri_format)
-            if uri_prefix is not None:
-                return uri_prefix
+        if priority is None:
+            uri_prefix = self._get_resolved("uri_prefix", self._resolve_uri_prefix)
+        else:
+            uri_prefix = self._resolve_uri_prefix(priority)
+        if uri_prefix is not None:
+            return uri_prefix
         if stubs:
             prefix = self.get_preferred_prefix() or self.prefix
             return f"https://bioregistry.io/{prefix}:"
@@ -2200,6 +2272,13 @@ class Resource(BaseModel):
             raise ValueError
         return None
 
+    def _resolve_uri_prefix(self, priority: Sequence[str] | None = None) -> str | None:
+        for uri_format in self._iterate_uri_formats(priority):
+            uri_prefix = self._clip_uri_format(uri_format)
+            if uri_prefix is not None:
+                return uri_prefix
+        return None
+
     def _clip_uri_format(self, uri_format: str | None) -> str | None:
         if uri_format is None or uri_format == "None":
             return None
@@ -2241,11 +2320,17 @@ class Resource(BaseModel):
         :returns: A set of URI format strings, containing ``$1`` where a local unique
             identifier should be formatted in.
         """
-        uri_formats = itt.chain.from_iterable(
-            _yield_protocol_variations(uri_format)
-            for uri_format in self._iter_uri_formats(enforce_w3c=enforce_w3c)
+        return set(
+            self._get_resolved(
+                f"uri_formats_w3c={enforce_w3c}",
+                lambda: frozenset(
+                    itt.chain.from_iterable(
+                        _yield_protocol_variations(uri_format)
+                        for uri_format in self._iter_uri_formats(enforce_w3c=enforce_w3c)
+                    )
+                ),
+            )
         )
-        return set(uri_formats)
 
     def _iter_uri_formats(self, *, enforce_w3c: bool = False) -> Iterable[str]:
         if self.uri_format:
@@ -2357,16 +2442,14 @@ class Resource(BaseModel):
         >>> get_resource("pdb").standardize_identifier("00000020")
         '00000020'
         """
-        icf = identifier.casefold()
-        banana = self.get_banana()
-        peels = [self.get_banana_peel(), "_"]
-        for peel in peels:
-            prebanana = f"{banana}{peel}".casefold()
-            if banana and icf.startswith(prebanana):
-                return identifier[len(prebanana) :]
-            elif icf.startswith(f"{self.prefix.casefold()}{peel}"):
-                return identifier[len(self.prefix) + len(peel) :]
-        return identifier
+        return self._get_identifier_stripper().strip(identifier)
+
+    def _get_identifier_stripper(self) -> _IdentifierStripper:
+        """Get the precompiled leads for :meth:`standardize_identifier`."""
+        return self._get_resolved(
+            "identifier_stripper",
+            lambda: _IdentifierStripper(self.prefix, self.get_banana(), self.get_banana_peel()),
+        )
 
     def get_miriam_curie(self, identifier: str) -> str | None:
         """Get the MIRIAM-flavored CURIE."""
@@ -3527,6 +3610,39 @@ def _clean_pattern(rv: str) -> str:
     return rv
 
 
+class _IdentifierStripper:
+    """Removes a banana or redundant prefix from identifiers.
+
+    The casefolded leads that get removed, i.e., the banana and the prefix followed by
+    the banana peel or an underscore, are built once, in the order they get checked.
+    See :meth:`Resource.standardize_identifier`.
+    """
+
+    __slots__ = ("cuts", "leads")
+
+    def __init__(self, prefix: str, banana: str | None, peel: str) -> None:
+        """Build the leads for the resource with the given prefix, banana, and peel."""
+        cuts: dict[str, int] = {}
+        for peel_ in dict.fromkeys((peel, "_")):
+            if banana:
+                prebanana = f"{banana}{peel_}".casefold()
+                cuts.setdefault(prebanana, len(prebanana))
+            cuts.setdefault(f"{prefix.casefold()}{peel_}", len(prefix) + len(peel_))
+        self.leads = tuple(cuts)
+        self.cuts = tuple(cuts.values())
+
+    def strip(self, identifier: str) -> str:
+        """Remove the first lead that matches, if any, from the identifier."""
+        icf = identifier.casefold()
+        # most identifiers don't have a lead, so check all of them at once first
+        if not icf.startswith(self.leads):
+            return identifier
+        for lead, cut in zip(self.leads, self.cuts, strict=True):
+            if icf.startswith(lead):
+                return identifier[cut:]
+        return identifier  # pragma: no cover
+
+
 def _allowed_uri_format(rv: str) -> bool:
     """Check that a URI format doesn't have another resolver in it."""
     return (
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import pickle
+import sys
+import tempfile
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Callable, Hashable, Iterator, Mapping, MutableMapping
 from functools import lru_cache
 from operator import attrgetter
 from pathlib import Path
-from typing import TypeAlias
+from types import MappingProxyType
+from typing import Any, TypeAlias, TypeVar
 
+import pydantic
+import pystow
 import sssom_pydantic
 from sssom_pydantic import SemanticMapping
 
 from .constants import (
+    BIOREGISTRY_MODULE,
     BIOREGISTRY_PATH,
     COLLECTIONS_PATH,
     CONTEXTS_PATH,
@@ -22,9 +31,12 @@ from .constants import (
     METAREGISTRY_PATH,
 )
 from .schema import Collection, Context, Registry, Resource
+from .schema import struct as _struct
 from .schema.struct import CollectionAnnotation
+from .version import VERSION
 
 __all__ = [
+    "LazyRegistry",
     "OrcidStr",
     "SemanticMapping",
     "add_collection",
@@ -56,14 +68,100 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+X = TypeVar("X")
+
+#: Increment this when the way snapshots are built changes, to invalidate old ones
+SNAPSHOT_VERSION = 3
+#: The directory in which pickled snapshots of parsed data files are stored
+SNAPSHOT_MODULE = BIOREGISTRY_MODULE.module("snapshots")
+#: The source of the data model, which determines the layout of pickled objects
+_STRUCT_PATH = Path(_struct.__file__)
+
+
+def _use_snapshots() -> bool:
+    """Check if snapshots are enabled, e.g., with the ``BIOREGISTRY_SNAPSHOT`` environment variable."""
+    return bool(pystow.get_config("bioregistry", "snapshot", dtype=bool, default=True))
+
+
+def _get_snapshot_key(path: Path) -> str:
+    """Get a key for a data file based on its contents and the version of the data model."""
+    hasher = hashlib.sha256()
+    hasher.update(f"{SNAPSHOT_VERSION}:{VERSION}:{pydantic.VERSION}".encode())
+    hasher.update(_STRUCT_PATH.read_bytes())
+    hasher.update(path.read_bytes())
+    return hasher.hexdigest()[:32]
+
+
+def _from_snapshot(name: str, path: str | Path, func: Callable[[Path], X]) -> X:
+    """Load a parsed data file from a snapshot if it's fresh, otherwise parse it and store a new snapshot.
+
+    :param name: The name of the data file, used in the snapshot file name
+    :param path: The path to the data file
+    :param func: A function that parses and validates the data file
+
+    :returns: The result of the function, either freshly built or unpickled
+    """
+    path = Path(path)
+    if not _use_snapshots():
+        return func(path)
+
+    key = _get_snapshot_key(path)
+    snapshot_path = SNAPSHOT_MODULE.join(name=f"{name}-{key}.pkl")
+    if snapshot_path.is_file():
+        try:
+            with snapshot_path.open("rb") as file:
+                # snapshots are only ever written by this function, into
+                # the user's own pystow directory
+                return pickle.load(file)  # type:ignore[no-any-return]  # noqa:S301
+        except Exception as e:
+            logger.warning("could not load snapshot %s, rebuilding: %s", snapshot_path, e)
+
+    rv = func(path)
+    try:
+        _write_snapshot(rv, snapshot_path)
+    except OSError as e:
+        logger.debug("could not write snapshot %s: %s", snapshot_path, e)
+    else:
+        for stale_path in snapshot_path.parent.glob(f"{name}-*.pkl"):
+            if stale_path != snapshot_path:
+                stale_path.unlink(missing_ok=True)
+    return rv
+
+
+def _write_snapshot(obj: object, path: Path) -> None:
+    # write to a temporary file then move it in place so parallel
+    # processes never see a half-written snapshot
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def clear_snapshots() -> None:
+    """Delete all snapshots of parsed data files."""
+    for path in SNAPSHOT_MODULE.base.glob("*.pkl"):
+        path.unlink(missing_ok=True)
+
 
 @lru_cache(maxsize=1)
 def read_metaregistry() -> Mapping[str, Registry]:
-    """Read the metaregistry."""
-    return _read_metaregistry(METAREGISTRY_PATH)
+    """Read the metaregistry.
+
+    The result is shared with the default :class:`bioregistry.Manager`, so it's
+    read-only. Make a copy with :func:`dict` to modify it.
+    """
+    return MappingProxyType(_read_metaregistry(METAREGISTRY_PATH))
 
 
 def _read_metaregistry(path: str | Path) -> Mapping[str, Registry]:
+    return _from_snapshot("metaregistry", path, _parse_metaregistry)
+
+
+def _parse_metaregistry(path: Path) -> Mapping[str, Registry]:
     with open(path, encoding="utf-8") as file:
         data = json.load(file)
     return {
@@ -79,8 +177,16 @@ def registries() -> list[Registry]:
 
 @lru_cache(maxsize=1)
 def read_registry() -> Mapping[str, Resource]:
-    """Read the Bioregistry as JSON."""
-    return _registry_from_path(BIOREGISTRY_PATH)
+    """Read the Bioregistry as JSON.
+
+    The result is shared with the default :class:`bioregistry.Manager` so the
+    registry only gets parsed and held in memory once per process. Therefore,
+    it's read-only. Make a copy with :func:`dict` to add or remove resources.
+    Modifying a resource in place affects every manager using this registry.
+
+    Resources are validated lazily, see :class:`LazyRegistry`.
+    """
+    return _registry_from_path(BIOREGISTRY_PATH).copy(read_only=True)
 
 
 def resources() -> list[Resource]:
@@ -88,12 +194,154 @@ def resources() -> list[Resource]:
     return sorted(read_registry().values(), key=attrgetter("prefix"))
 
 
-def _registry_from_path(path: str | Path) -> Mapping[str, Resource]:
+def _registry_from_path(path: str | Path) -> LazyRegistry:
+    return LazyRegistry(_from_snapshot("registry", path, _parse_registry))
+
+
+def _parse_registry(path: Path) -> dict[str, dict[str, Any]]:
     with open(path, encoding="utf-8") as file:
-        data = json.load(file)
+        data: dict[str, dict[str, Any]] = json.load(file)
+    memo: dict[Hashable, Any] = {}
+    rv = {}
     for prefix, value in data.items():
         value.setdefault("prefix", prefix)
-    return {prefix: Resource.model_validate(value) for prefix, value in data.items()}
+        rv[sys.intern(prefix)] = _deduplicate(value, memo)
+    return rv
+
+
+def _deduplicate(obj: X, memo: dict[Hashable, Any]) -> X:
+    """Intern strings and share identical lists and dictionaries in parsed JSON.
+
+    External registry records repeat the same keys, licenses, URLs, and statuses
+    many times, so this cuts the memory taken up by the raw registry substantially.
+    Shared objects survive pickling, so snapshots stay deduplicated. The result
+    must not be modified in place.
+    """
+    rv: Any
+    if isinstance(obj, str):
+        return sys.intern(obj)  # type:ignore[return-value]
+    elif isinstance(obj, dict):
+        rv = {sys.intern(key): _deduplicate(value, memo) for key, value in obj.items()}
+        memo_key: Hashable = (dict, *((key, _get_memo_key(value)) for key, value in rv.items()))
+    elif isinstance(obj, list):
+        rv = [_deduplicate(value, memo) for value in obj]
+        memo_key = (list, *(_get_memo_key(value) for value in rv))
+    else:
+        return obj
+    return memo.setdefault(memo_key, rv)  # type:ignore[no-any-return]
+
+
+def _get_memo_key(obj: Any) -> Hashable:
+    if isinstance(obj, dict | list):
+        # nested containers are already deduplicated, so equal ones are identical
+        return id(obj)
+    # include the type, since 1, 1.0, and True are equal
+    return type(obj), obj
+
+
+class LazyRegistry(MutableMapping[str, Resource]):
+    """A registry that validates each resource from its raw JSON record on first access.
+
+    Looking up a prefix, e.g., with ``registry[prefix]`` or :meth:`Manager.get_resource`,
+    only validates that resource. Iterating over values or items validates resources
+    on the fly. Copies made with :meth:`copy` share the raw records and validated
+    resources, but keep track of their own additions and removals.
+    """
+
+    def __init__(self, records: Mapping[str, Mapping[str, Any]]) -> None:
+        """Initialize the registry.
+
+        :param records: A mapping from prefixes to raw records that get validated
+            into :class:`Resource` objects. This is never modified.
+        """
+        self.read_only = False
+        self._records = records
+        self._resources: dict[str, Resource] = {}
+        self._overrides: dict[str, Resource] = {}
+        self._removed: set[str] = set()
+
+    def copy(self, *, read_only: bool = False) -> LazyRegistry:
+        """Get a copy of the registry that shares the raw records and validated resources."""
+        rv = LazyRegistry(self._records)
+        rv.read_only = read_only
+        rv._resources = self._resources
+        rv._overrides = dict(self._overrides)
+        rv._removed = set(self._removed)
+        return rv
+
+    def get_field(self, prefix: str, key: str) -> Any:
+        """Get a field of a resource without validating it, if it's not already validated.
+
+        :param prefix: The prefix of the resource
+        :param key: The name of a field on :class:`Resource`
+        :returns: The value of the field, as it appears in the raw record
+        :raises KeyError: if the prefix isn't in the registry
+        """
+        resource = self._overrides.get(prefix) or self._resources.get(prefix)
+        if resource is not None:
+            return getattr(resource, key)
+        if prefix in self._removed:
+            raise KeyError(prefix)
+        return self._records[prefix].get(key)
+
+    def __getitem__(self, prefix: str) -> Resource:
+        """Get a resource, validating it if this is the first time it's accessed."""
+        try:
+            return self._overrides[prefix]
+        except KeyError:
+            pass
+        if prefix in self._removed:
+            raise KeyError(prefix)
+        try:
+            return self._resources[prefix]
+        except KeyError:
+            pass
+        resource = Resource.model_validate(self._records[prefix])
+        # another thread might have gotten here first, so make sure everyone gets the same object
+        return self._resources.setdefault(prefix, resource)
+
+    def __setitem__(self, prefix: str, resource: Resource) -> None:
+        """Add or replace a resource."""
+        self._raise_on_read_only()
+        self._overrides[prefix] = resource
+        self._removed.discard(prefix)
+
+    def __delitem__(self, prefix: str) -> None:
+        """Remove a resource."""
+        self._raise_on_read_only()
+        found = self._overrides.pop(prefix, None) is not None
+        if prefix in self._records and prefix not in self._removed:
+            self._removed.add(prefix)
+            found = True
+        if not found:
+            raise KeyError(prefix)
+
+    def _raise_on_read_only(self) -> None:
+        if self.read_only:
+            raise TypeError("registry is read-only. Make a copy to modify it")
+
+    def __contains__(self, prefix: object) -> bool:
+        """Check if the prefix is in the registry, without validating its resource."""
+        if prefix in self._overrides:
+            return True
+        return prefix in self._records and prefix not in self._removed
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over prefixes, without validating resources."""
+        for prefix in self._records:
+            if prefix not in self._removed:
+                yield prefix
+        for prefix in self._overrides:
+            if prefix not in self._records:
+                yield prefix
+
+    def __len__(self) -> int:
+        """Count the resources in the registry."""
+        n_added = sum(prefix not in self._records for prefix in self._overrides)
+        return len(self._records) - len(self._removed) + n_added
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} with {len(self)} resources>"
 
 
 def add_resource(resource: Resource) -> None:
@@ -142,7 +390,11 @@ def _read_mappings(predicate_curie: str) -> dict[str, dict[str, set[str]]]:
 @lru_cache(maxsize=1)
 def read_mappings() -> list[SemanticMapping]:
     """Read curated mappings as a nested dict data structure."""
-    mappings, _, _ = sssom_pydantic.read(CURATED_MAPPINGS_PATH)
+    return _from_snapshot("mappings", CURATED_MAPPINGS_PATH, _parse_mappings)
+
+
+def _parse_mappings(path: Path) -> list[SemanticMapping]:
+    mappings, _, _ = sssom_pydantic.read(path)
     return mappings
 
 
@@ -155,8 +407,12 @@ def is_mismatch(bioregistry_prefix: str, external_metaprefix: str, external_pref
 
 @lru_cache(maxsize=1)
 def read_collections() -> Mapping[str, Collection]:
-    """Read the manually curated collections."""
-    return _collections_from_path(COLLECTIONS_PATH)
+    """Read the manually curated collections.
+
+    The result is shared with the default :class:`bioregistry.Manager`, so it's
+    read-only. Make a copy with :func:`dict` to modify it.
+    """
+    return MappingProxyType(_collections_from_path(COLLECTIONS_PATH))
 
 
 def get_collection_mappings(external_prefix: str) -> dict[str, str]:
@@ -170,6 +426,10 @@ def get_collection_mappings(external_prefix: str) -> dict[str, str]:
 
 
 def _collections_from_path(path: str | Path) -> dict[str, Collection]:
+    return _from_snapshot("collections", path, _parse_collections)
+
+
+def _parse_collections(path: Path) -> dict[str, Collection]:
     with open(path, encoding="utf-8") as file:
         data = json.load(file)
     return {
@@ -363,11 +623,19 @@ def read_status_contributions(
 
 @lru_cache(1)
 def read_contexts() -> Mapping[str, Context]:
-    """Get a mapping from context keys to contexts."""
-    return _contexts_from_path(CONTEXTS_PATH)
+    """Get a mapping from context keys to contexts.
+
+    The result is shared with the default :class:`bioregistry.Manager`, so it's
+    read-only. Make a copy with :func:`dict` to modify it.
+    """
+    return MappingProxyType(_contexts_from_path(CONTEXTS_PATH))
 
 
 def _contexts_from_path(path: str | Path) -> Mapping[str, Context]:
+    return _from_snapshot("contexts", path, _parse_contexts)
+
+
+def _parse_contexts(path: Path) -> Mapping[str, Context]:
     with open(path, encoding="utf-8") as file:
         data = json.load(file)
     return {key: Context(**data) for key, data in data.items()}
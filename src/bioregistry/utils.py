@@ -105,6 +105,10 @@ class NormDict(dict[str, str]):
             return False
         return super().__contains__(_norm(item))
 
+    def __delitem__(self, key: str) -> None:
+        """Delete an item from the dictionary after lexically normalizing it."""
+        super().__delitem__(_norm(key))
+
     def get(self, key: str, default: str | Any = None) -> str:
         """Get an item from the dictionary after lexically normalizing it."""
         return cast(str, super().get(_norm(key), default))
@@ -112,10 +116,12 @@ class NormDict(dict[str, str]):
 
 def _norm(s: str) -> str:
     """Normalize a string for dictionary key usage."""
-    rv = s.casefold().lower()
-    for x in " -_./":
-        rv = rv.replace(x, "")
-    return rv
+    # casefolding only differs from lowercasing outside of ASCII
+    rv = s.lower() if s.isascii() else s.casefold().lower()
+    if rv.isalnum():
+        # most prefixes don't have any of the characters that get removed
+        return rv
+    return rv.replace(" ", "").replace("-", "").replace("_", "").replace(".", "").replace("/", "")
 
 
 def norm(s: str) -> str:
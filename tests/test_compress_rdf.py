@@ -0,0 +1,105 @@
+"""Test compressing the IRIs in RDF files."""
+
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from bioregistry import manager
+from bioregistry.compress_rdf import _get_compressor, compress_rdf_file
+
+LINES = [
+    "# a comment",
+    "",
+    (
+        "<http://purl.obolibrary.org/obo/GO_0000001> "
+        "<http://www.w3.org/2000/01/rdf-schema#subClassOf> "
+        "<http://purl.obolibrary.org/obo/GO_0048308> ."
+    ),
+    (
+        "<http://purl.obolibrary.org/obo/GO_0000001> "
+        '<http://www.w3.org/2000/01/rdf-schema#label> "mitochondrion\\t\\"inheritance\\""@en .'
+    ),
+    '_:b1 <https://example.org/nope/p> "1"^^<http://www.w3.org/2001/XMLSchema#integer> .',
+    "not a triple",
+]
+
+
+class TestCompressRDF(unittest.TestCase):
+    """Test compressing the IRIs in RDF files."""
+
+    def test_compress(self) -> None:
+        """Test compressing IRIs gives the same results as the manager."""
+        compressor = _get_compressor(manager, use_preferred=False)
+        preferred_compressor = _get_compressor(manager, use_preferred=True)
+        uris = ["https://example.org/nope", "http://purl.obolibrary.org/obo/"]
+        for prefix in list(manager.registry)[:500]:
+            example = manager.get_example(prefix) or "1234"
+            uris.extend(uri for _, uri in manager.get_providers_list(prefix, example))
+        for uri in uris:
+            self.assertEqual(manager.compress(uri), compressor.compress(uri), msg=uri)
+            self.assertEqual(
+                manager.compress(uri, use_preferred=True),
+                preferred_compressor.compress(uri),
+                msg=uri,
+            )
+
+    def test_compress_file(self) -> None:
+        """Test compressing a file, with and without multiple processes."""
+        with tempfile.TemporaryDirectory() as directory:
+            directory_path = Path(directory)
+            path = directory_path.joinpath("test.nt.gz")
+            with gzip.open(path, "wt") as file:
+                file.write("\n".join(LINES * 3))
+
+            for processes in [1, 2]:
+                with self.subTest(processes=processes):
+                    output_path = directory_path.joinpath(f"test-{processes}.tsv")
+                    unparsable_path = directory_path.joinpath(f"unparsable-{processes}.txt")
+                    summary = compress_rdf_file(
+                        path,
+                        output_path,
+                        unparsable_path=unparsable_path,
+                        processes=processes,
+                        chunk_size=4,
+                    )
+                    self.assertEqual(9, summary.statements)
+                    self.assertEqual(3, summary.skipped)
+                    self.assertEqual(1, summary.unparsable)
+                    self.assertEqual(
+                        ["https://example.org/nope/p"], unparsable_path.read_text().splitlines()
+                    )
+                    rows = [line.split("\t") for line in output_path.read_text().splitlines()]
+                    self.assertEqual(["subject", "predicate", "object"], rows[0])
+                    self.assertEqual(["go:0000001", "rdfs:subClassOf", "go:0048308"], rows[1])
+                    self.assertEqual(
+                        ["go:0000001", "rdfs:label", '"mitochondrion\\t\\"inheritance\\""@en'],
+                        rows[2],
+                    )
+                    self.assertEqual(
+                        [
+                            "_:b1",
+                            "<https://example.org/nope/p>",
+                            '"1"^^<http://www.w3.org/2001/XMLSchema#integer>',
+                        ],
+                        rows[3],
+                    )
+
+    def test_compress_quads(self) -> None:
+        """Test compressing an N-Quads file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("test.nq")
+            path.write_text(
+                "<http://purl.obolibrary.org/obo/GO_0000001> "
+                "<http://www.w3.org/2000/01/rdf-schema#subClassOf> "
+                "<http://purl.obolibrary.org/obo/GO_0048308> "
+                "<http://purl.obolibrary.org/obo/go.owl> .\n"
+                "_:b1 <http://www.w3.org/2000/01/rdf-schema#label> "
+                '"test" .\n'
+            )
+            output_path = Path(directory).joinpath("test.tsv")
+            compress_rdf_file(path, output_path)
+            rows = [line.split("\t") for line in output_path.read_text().splitlines()]
+            self.assertEqual(["subject", "predicate", "object", "graph"], rows[0])
+            self.assertEqual("obo:go.owl", rows[1][3])
+            self.assertEqual(["_:b1", "rdfs:label", '"test"', ""], rows[2])
@@ -0,0 +1,44 @@
+"""Test the cost of importing the package."""
+
+import json
+import subprocess
+import sys
+import unittest
+
+SCRIPT = """\
+import json, time
+start = time.perf_counter()
+import bioregistry
+from bioregistry import resource_manager
+elapsed = time.perf_counter() - start
+loaded = resource_manager.manager._manager is not None
+print(json.dumps({"elapsed": elapsed, "loaded": loaded}))
+"""
+
+#: A generous upper bound on import time, in seconds, so slow CI runners don't flake
+MAX_IMPORT_SECONDS = 4.0
+
+
+class TestImport(unittest.TestCase):
+    """Test the cost of importing the package."""
+
+    def test_lazy_manager(self) -> None:
+        """Test that importing doesn't load the registry."""
+        # run in a fresh interpreter, since the test suite has already imported everything
+        res = subprocess.run(  # noqa:S603
+            [sys.executable, "-c", SCRIPT],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        data = json.loads(res.stdout.strip().splitlines()[-1])
+        self.assertFalse(data["loaded"], msg="importing bioregistry loaded the default manager")
+        self.assertLess(data["elapsed"], MAX_IMPORT_SECONDS)
+
+    def test_manager_loads(self) -> None:
+        """Test that the default manager loads on first use."""
+        import bioregistry
+
+        self.assertEqual("go", bioregistry.manager.normalize_prefix("GO"))
+        self.assertIsNotNone(bioregistry.manager.get_resource("go"))
+        self.assertEqual("go", bioregistry.normalize_prefix("GO"))
@@ -1,12 +1,16 @@
 """Tests for managers."""
 
 import unittest
-from typing import ClassVar
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from curies.api import NoCURIEDelimiterError, PrefixStandardizationError
 
 import bioregistry
 from bioregistry import Manager, Resource, parse_curie
 from bioregistry.export.rdf_export import get_full_rdf
 from bioregistry.resource_manager import MappingsDiff
+from bioregistry.schema_utils import read_collections, read_registry
 
 
 class TestResourceManager(unittest.TestCase):
@@ -248,6 +252,99 @@ class TestResourceManager(unittest.TestCase):
                 self.assertEqual(p, actual_prefix)
                 self.assertEqual(i, actual_i)
 
+    def test_parse_curies(self) -> None:
+        """Test parsing CURIEs in bulk gives the same results as one at a time."""
+        curies = ["nope", "nope:1234", "GO:GO:0000001", "go:0000001"]
+        for prefix in self.manager.registry:
+            example = self.manager.get_example(prefix) or "1234"
+            curies.extend([f"{prefix}:{example}", f"{prefix.upper()}:{prefix}:{example}"])
+        for use_preferred in [False, True]:
+            with self.subTest(use_preferred=use_preferred):
+                prefixes, identifiers = self.manager.parse_curies(
+                    curies, use_preferred=use_preferred
+                )
+                for curie, prefix, identifier in zip(curies, prefixes, identifiers, strict=True):
+                    expected = self.manager.parse_curie(curie, use_preferred=use_preferred)
+                    self.assertEqual(expected or (None, None), (prefix, identifier), msg=curie)
+                self.assertEqual(
+                    [
+                        self.manager.normalize_curie(curie, use_preferred=use_preferred)
+                        for curie in curies
+                    ],
+                    self.manager.normalize_curies(curies, use_preferred=use_preferred),
+                )
+
+        with self.assertRaises(NoCURIEDelimiterError):
+            self.manager.parse_curies(["go:0000001", "nope"], strict=True)
+        with self.assertRaises(PrefixStandardizationError):
+            self.manager.parse_curies(["go:0000001", "nope:1234"], strict=True)
+
+    def test_parse_uris(self) -> None:
+        """Test parsing URIs in bulk gives the same results as one at a time."""
+        uris = ["https://example.org/nope", ""]
+        for prefix in self.manager.registry:
+            example = self.manager.get_example(prefix) or "1234"
+            uris.extend(uri for _, uri in self.manager.get_providers_list(prefix, example))
+        for use_preferred in [False, True]:
+            with self.subTest(use_preferred=use_preferred):
+                prefixes, identifiers = self.manager.parse_uris(uris, use_preferred=use_preferred)
+                for uri, prefix, identifier in zip(uris, prefixes, identifiers, strict=True):
+                    expected = self.manager.parse_uri(uri, use_preferred=use_preferred)
+                    self.assertEqual(tuple(expected), (prefix, identifier), msg=uri)
+
+        manager = Manager()
+        self.assertEqual(([None], [None]), manager.parse_uris(["https://example.org/test/1"]))
+        manager.add_resource(Resource(prefix="test1234", uri_format="https://example.org/test/$1"))
+        self.assertEqual((["test1234"], ["1"]), manager.parse_uris(["https://example.org/test/1"]))
+
+    def test_validate_curies(self) -> None:
+        """Test validating in bulk gives the same results as one at a time."""
+        curies = ["nope", "nope:1234", "GO:GO:0000001", "go:0000001", "go:1"]
+        for prefix in self.manager.registry:
+            example = self.manager.get_example(prefix) or "1234"
+            curies.extend([f"{prefix}:{example}", f"{prefix.upper()}:{prefix}:{example}"])
+        prefixes, _, identifiers = zip(*(curie.partition(":") for curie in curies), strict=True)
+        frozen = self.manager.freeze()
+        for manager in [self.manager, frozen]:
+            for standardize in [False, True]:
+                with self.subTest(frozen=manager is frozen, standardize=standardize):
+                    if standardize:
+                        func = manager.is_standardizable_curie
+                    else:
+                        func = manager.is_valid_curie
+                    result = manager.validate_curies(curies, standardize=standardize)
+                    self.assertEqual([func(curie) for curie in curies], result.mask.tolist())
+                    self.assertEqual(1, result.malformed)
+                    self.assertEqual(
+                        len(curies),
+                        result.mask.sum()
+                        + result.malformed
+                        + sum(result.invalid_prefixes.values())
+                        + sum(result.invalid_identifiers.values()),
+                    )
+
+                    result = manager.validate_identifiers(
+                        prefixes, identifiers, standardize=standardize
+                    )
+                    self.assertEqual(
+                        [func(curie) for curie in curies[1:]], result.mask.tolist()[1:]
+                    )
+
+    def test_standardize_identifiers(self) -> None:
+        """Test standardizing identifiers in bulk gives the same results as one at a time."""
+        frozen = self.manager.freeze()
+        for prefix, resource in self.manager.registry.items():
+            example = self.manager.get_example(prefix) or "1234"
+            identifiers = [example, f"{prefix.upper()}:{example}", f"{prefix}_{example}"]
+            if banana := resource.get_banana():
+                identifiers.append(f"{banana}{resource.get_banana_peel()}{example}")
+            expected = [resource.standardize_identifier(i) for i in identifiers]
+            self.assertEqual(
+                expected, self.manager.standardize_identifiers(prefix, identifiers), msg=prefix
+            )
+            self.assertEqual(expected, frozen.standardize_identifiers(prefix, identifiers))
+        self.assertEqual(["GO:1"], self.manager.standardize_identifiers("nope", ["GO:1"]))
+
     def test_external_registry_mappings(self) -> None:
         """Test external registry mappings."""
         res = self.manager.get_external_mappings("obofoundry", "bioportal")
@@ -285,3 +382,156 @@ class TestResourceManager(unittest.TestCase):
 
         self.assertIsNotNone(manager.get_resource(test_prefix))
         self.assertIsNotNone(manager.get_resource(test_synonym))
+
+    def test_mapping_index(self) -> None:
+        """Test the mapping index gives the same mappings as looking up each resource."""
+        index = self.manager.get_mapping_index()
+        for metaprefix in self.manager.metaregistry:
+            for use_obo_preferred in [False, True]:
+                with self.subTest(metaprefix=metaprefix, use_obo_preferred=use_obo_preferred):
+                    expected = {}
+                    for prefix, resource in self.manager.registry.items():
+                        mapped_prefix = resource.get_mapped_prefix(
+                            metaprefix, use_obo_preferred=use_obo_preferred
+                        )
+                        if mapped_prefix is not None:
+                            expected[prefix] = mapped_prefix
+                    self.assertEqual(
+                        expected, index.get_map(metaprefix, use_obo_preferred=use_obo_preferred)
+                    )
+                    invmap = index.get_invmap(metaprefix, use_obo_preferred=use_obo_preferred)
+                    for prefix, external_prefix in expected.items():
+                        self.assertIn(external_prefix, invmap)
+                        if invmap[external_prefix] != prefix:
+                            # only if another resource or a version/provided by mapping wins
+                            self.assertIn(
+                                invmap[external_prefix],
+                                {
+                                    *self.manager.has_version_mappings,
+                                    *self.manager.provided_by_mappings,
+                                    *(p for p, e in expected.items() if e == external_prefix),
+                                },
+                            )
+
+    def test_add_resource_indexes(self) -> None:
+        """Test adding a resource updates indexes the same way as building a new manager."""
+        manager = Manager()
+        # warm up the caches, so they get updated in place
+        _ = manager.converter
+        manager.get_registry_map("obofoundry")
+        manager.get_registry_invmap("obofoundry")
+
+        resource = Resource(
+            prefix="test1234",
+            synonyms=["testalt"],
+            uri_format="https://example.org/test1234/$1",
+            has_canonical="go",
+            obofoundry={"prefix": "test1234"},
+        )
+        manager.add_resource(resource)
+        rebuilt = Manager(registry=manager.registry)
+
+        self.assertEqual("test1234", manager.normalize_prefix("TEST_ALT"))
+        self.assertEqual(rebuilt.canonical_for, manager.canonical_for)
+        self.assertIn("test1234", manager.get_canonical_for("go"))
+        self.assertEqual(
+            rebuilt.get_registry_map("obofoundry"), manager.get_registry_map("obofoundry")
+        )
+        self.assertEqual(
+            rebuilt.get_registry_invmap("obofoundry"), manager.get_registry_invmap("obofoundry")
+        )
+        self.assertEqual(rebuilt.converter.prefix_map, manager.converter.prefix_map)
+        self.assertEqual(rebuilt.converter.reverse_prefix_map, manager.converter.reverse_prefix_map)
+        self.assertEqual(
+            ("go", "0000001"), manager.parse_uri("https://example.org/test1234/0000001")
+        )
+
+        # replacing a resource removes the old one from the indexes
+        manager.add_resource(Resource(prefix="test1234", uri_format="https://example.org/$1"))
+        self.assertIsNone(manager.normalize_prefix("TEST_ALT"))
+        self.assertNotIn("test1234", manager.get_canonical_for("go"))
+        self.assertNotIn("test1234", manager.get_registry_map("obofoundry"))
+
+        with self.assertRaises(KeyError):
+            manager.add_resource(Resource(prefix="test5678", synonyms=["GO"]))
+
+        collection_id = next(iter(manager.collections))
+        manager.add_to_collection(collection_id, "test1234")
+        self.assertEqual([collection_id], manager.get_in_collections("test1234"))
+
+    def test_prefix_cache(self) -> None:
+        """Test memoizing prefix normalization, including misses."""
+        manager = Manager()
+        self.assertIsNone(manager.normalize_prefix("test1234"))
+        self.assertIsNone(manager.normalize_prefix("test1234"))
+        self.assertEqual("go", manager.normalize_prefix("GO"))
+        self.assertEqual("go", manager.normalize_prefix("GO"))
+        info = manager.get_prefix_cache_info()
+        self.assertEqual(2, info.hits)
+        self.assertEqual(2, info.misses)
+
+        # a miss that's been cached doesn't hide a resource that gets added later
+        manager.add_resource(Resource(prefix="test1234"))
+        self.assertEqual("test1234", manager.normalize_prefix("TEST1234"))
+
+        frozen = manager.freeze()
+        self.assertEqual("test1234", frozen.normalize_prefix("TEST1234"))
+        self.assertEqual(0, frozen.get_prefix_cache_info().hits)
+
+    def test_shared_registry(self) -> None:
+        """Test the default manager shares the parsed registry with :func:`read_registry`."""
+        manager = Manager()
+        registry = read_registry()
+        self.assertIs(registry["go"], manager.registry["go"])
+        with self.assertRaises(TypeError):
+            registry["test1234"] = Resource(prefix="test1234")  # type:ignore[index]
+
+        # copy on write when adding to the manager
+        manager.add_resource(Resource(prefix="test1234", name="Test"))
+        self.assertIn("test1234", manager.registry)
+        self.assertNotIn("test1234", registry)
+        self.assertNotIn("test1234", Manager().registry)
+
+        collection_id = next(iter(manager.collections))
+        manager.add_to_collection(collection_id, "test1234")
+        self.assertIn("test1234", manager.collections[collection_id].resources)
+        self.assertNotIn("test1234", read_collections()[collection_id].resources)
+
+    def test_freeze(self) -> None:
+        """Test a frozen manager gives the same results as the original."""
+        frozen = self.manager.freeze()
+        getters: list[Callable[[Manager, str], Any]] = [
+            Manager.get_pattern,
+            Manager.get_synonyms,
+            Manager.get_preferred_prefix,
+            Manager.get_uri_prefix,
+            Manager.get_uri_format,
+        ]
+        checkers: list[Callable[[Manager, str, str], Any]] = [
+            Manager.is_valid_identifier,
+            Manager.is_standardizable_identifier,
+            Manager.get_default_iri,
+            Manager.get_rdf_uri,
+            Manager.get_providers_list,
+        ]
+        self.assertIsNotNone(frozen.views)
+        self.assertIsNone(self.manager.views)
+        for prefix in self.manager.registry:
+            with self.subTest(prefix=prefix):
+                example = self.manager.get_example(prefix) or "1234"
+                for getter in getters:
+                    self.assertEqual(getter(self.manager, prefix), getter(frozen, prefix))
+                for checker in checkers:
+                    self.assertEqual(
+                        checker(self.manager, prefix, example), checker(frozen, prefix, example)
+                    )
+                self.assertEqual(
+                    self.manager.normalize_curie(f"{prefix}:{example}", use_preferred=True),
+                    frozen.normalize_curie(f"{prefix}:{example}", use_preferred=True),
+                )
+
+        # full resources get loaded on demand
+        self.assertEqual(self.manager.get_resource("go"), frozen.get_resource("go"))
+        self.assertEqual(self.manager.get_name("go"), frozen.get_name("go"))
+        with self.assertRaises(TypeError):
+            frozen.add_resource(Resource(prefix="test1234"))
@@ -97,3 +97,34 @@ class StructTest(unittest.TestCase):
         resource = Resource(prefix="test", uri_format="https://example.com/$1.html")
         converter = get_converter([resource])
         self.assertEqual({"test": "https://bioregistry.io/test:"}, converter.bimap)
+
+    def test_resolved_invalidation(self) -> None:
+        """Test that resolved fields are recalculated after the resource is modified."""
+        resource = Resource(prefix="test", miriam={"pattern": "^\\d+$"})
+        self.assertEqual("^\\d+$", resource.get_pattern())
+        self.assertIsNotNone(resource.get_pattern_re())
+        self.assertIsNone(resource.get_uri_prefix())
+        self.assertFalse(resource.is_deprecated())
+
+        resource.pattern = "^\\d{7}$"
+        self.assertEqual("^\\d{7}$", resource.get_pattern())
+        self.assertIsNone(resource.get_pattern_re().fullmatch("1"))  # type:ignore[union-attr]
+
+        resource["uri_format"] = "https://example.com/$1"
+        self.assertEqual("https://example.com/", resource.get_uri_prefix())
+
+        resource.deprecated = True
+        self.assertTrue(resource.is_deprecated())
+
+        # in-place modification of a mutable field requires explicit clearing
+        resource.synonyms = []
+        self.assertNotIn("https://bioregistry.io/tst:$1", resource.get_uri_formats())
+        resource.synonyms.append("tst")
+        resource.clear_resolved()
+        self.assertIn("https://bioregistry.io/tst:$1", resource.get_uri_formats())
+
+        # resolved fields don't affect equality
+        self.assertEqual(resource, resource.model_copy(deep=True))
+        fresh, resolved = Resource(prefix="test"), Resource(prefix="test")
+        resolved.get_uri_formats()
+        self.assertEqual(fresh, resolved)
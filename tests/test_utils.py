@@ -1,8 +1,17 @@
 """Test utilities."""
 
+import json
+import tempfile
 import unittest
+from collections.abc import Mapping
+from pathlib import Path
+from unittest import mock
 
+import pystow
+
+from bioregistry import Manager, Resource, schema_utils
 from bioregistry.external.obofoundry import get_obofoundry_example
+from bioregistry.memory import get_memory_usage
 from bioregistry.utils import backfill, deduplicate, get_ec_url
 
 
@@ -91,3 +100,129 @@ class TestDeduplicate(unittest.TestCase):
     def test_obolibrary_example(self) -> None:
         """Test looking up an example from the OBO Foundry PURL service configuration."""
         self.assertEqual("0011124", get_obofoundry_example("pcl"))
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test pickled snapshots of parsed data files."""
+
+    def setUp(self) -> None:
+        """Set up a temporary directory for the data and snapshots."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("bioregistry.json")
+        self.module = pystow.Module(Path(self.directory.name).joinpath("snapshots"))
+
+    def tearDown(self) -> None:
+        """Clean up the temporary directory."""
+        self.directory.cleanup()
+
+    def _read(self, data: dict[str, dict[str, str]]) -> Mapping[str, Resource]:
+        self.path.write_text(json.dumps(data))
+        with (
+            mock.patch.object(schema_utils, "SNAPSHOT_MODULE", self.module),
+            mock.patch.object(schema_utils, "_use_snapshots", return_value=True),
+        ):
+            return schema_utils._registry_from_path(self.path)
+
+    def test_snapshot(self) -> None:
+        """Test a snapshot is reused while fresh and rebuilt when stale."""
+        registry = self._read({"test": {"name": "Test"}})
+        self.assertEqual("Test", registry["test"].get_name())
+        snapshots = list(self.module.base.glob("registry-*.pkl"))
+        self.assertEqual(1, len(snapshots))
+
+        with mock.patch.object(schema_utils, "_parse_registry") as parse:
+            self.assertEqual(registry, self._read({"test": {"name": "Test"}}))
+            parse.assert_not_called()
+
+        registry = self._read({"test": {"name": "Test 2"}})
+        self.assertEqual("Test 2", registry["test"].get_name())
+        new_snapshots = list(self.module.base.glob("registry-*.pkl"))
+        self.assertEqual(1, len(new_snapshots), msg="stale snapshot should have been removed")
+        self.assertNotEqual(snapshots, new_snapshots)
+
+    def test_corrupt_snapshot(self) -> None:
+        """Test a corrupt snapshot gets rebuilt."""
+        self._read({"test": {"name": "Test"}})
+        (snapshot,) = self.module.base.glob("registry-*.pkl")
+        snapshot.write_bytes(b"nope")
+        with self.assertLogs(schema_utils.logger, level="WARNING"):
+            registry = self._read({"test": {"name": "Test"}})
+        self.assertEqual("Test", registry["test"].get_name())
+
+
+class TestDeduplicateRecords(unittest.TestCase):
+    """Test sharing identical parts of raw registry records."""
+
+    def test_deduplicate(self) -> None:
+        """Test identical sub-structures are shared, and the records are unchanged."""
+        license_ = {"license": "CC-BY-4.0", "status": "active", "flags": [1, True, 1.0]}
+        data = {
+            "a": {"miriam": {"prefix": "a", "extra": dict(license_)}},
+            "b": {"miriam": {"prefix": "b", "extra": json.loads(json.dumps(license_))}},
+            "c": {"miriam": {"prefix": "c", "extra": {**license_, "flags": [1, 1, 1]}}},
+        }
+        rv = schema_utils._deduplicate(data, {})
+        self.assertEqual(data, rv)
+        self.assertIs(rv["a"]["miriam"]["extra"], rv["b"]["miriam"]["extra"])
+        self.assertIsNot(rv["a"]["miriam"]["extra"], rv["c"]["miriam"]["extra"])
+        # 1, True, and 1.0 are equal, but they shouldn't get mixed up
+        self.assertEqual([int, bool, float], [type(x) for x in rv["a"]["miriam"]["extra"]["flags"]])
+        self.assertEqual([int, int, int], [type(x) for x in rv["c"]["miriam"]["extra"]["flags"]])
+
+        usage = get_memory_usage(rv, ["miriam"])
+        self.assertEqual({"miriam"}, set(usage))
+        self.assertEqual(3, usage["miriam"].records)
+        self.assertLess(usage["miriam"].size, usage["miriam"].unshared_size)
+
+
+class TestLazyRegistry(unittest.TestCase):
+    """Test lazily validating registries."""
+
+    def setUp(self) -> None:
+        """Set up a lazy registry."""
+        self.registry = schema_utils.LazyRegistry(
+            {
+                "a": {"prefix": "a", "name": "A", "synonyms": ["a1"]},
+                "b": {"prefix": "b", "name": "B", "part_of": "a"},
+            }
+        )
+
+    def test_lazy(self) -> None:
+        """Test resources are only validated when accessed."""
+        self.assertEqual(["a", "b"], list(self.registry))
+        self.assertIn("a", self.registry)
+        self.assertEqual(2, len(self.registry))
+        self.assertEqual("a", self.registry.get_field("b", "part_of"))
+        self.assertEqual({}, self.registry._resources)
+
+        resource = self.registry["a"]
+        self.assertIsInstance(resource, Resource)
+        self.assertEqual("A", resource.name)
+        self.assertIs(resource, self.registry["a"])
+        self.assertEqual({"a"}, set(self.registry._resources))
+
+        self.assertEqual(["A", "B"], [r.name for r in self.registry.values()])
+        self.assertIsNone(self.registry.get("c"))
+
+    def test_copy(self) -> None:
+        """Test copies share validated resources, but not modifications."""
+        read_only = self.registry.copy(read_only=True)
+        with self.assertRaises(TypeError):
+            read_only["c"] = Resource(prefix="c")
+
+        copy = read_only.copy()
+        copy["c"] = Resource(prefix="c")
+        del copy["a"]
+        self.assertEqual(["b", "c"], list(copy))
+        self.assertEqual(2, len(copy))
+        self.assertNotIn("a", copy)
+        self.assertEqual(["a", "b"], list(read_only))
+        self.assertIs(read_only["b"], copy["b"])
+
+    def test_manager(self) -> None:
+        """Test a manager built on a lazy registry."""
+        manager = Manager(self.registry, collections={}, contexts={})
+        self.assertEqual({"a": ["b"]}, manager.has_parts)
+        self.assertEqual("a", manager.normalize_prefix("a1"))
+        self.assertEqual({}, self.registry._resources)
+        self.assertEqual("A", manager.get_name("a"))
@@ -0,0 +1,57 @@
+"""Test reloading the data behind the web application."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from starlette.testclient import TestClient
+
+from bioregistry import Manager, Resource
+from bioregistry.app.impl import get_app, set_manager
+from bioregistry.app.reload import ManagerReloader
+
+
+class TestReload(unittest.TestCase):
+    """Tests for reloading the data behind the web application."""
+
+    def test_reload(self) -> None:
+        """Test that a reloaded manager is swapped into the app."""
+        fast_api, flask_app = get_app(manager=Manager(), return_flask=True)
+        client = TestClient(fast_api)
+        self.assertEqual(404, client.get("/api/registry/test1234").status_code)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("test.json")
+            path.write_text(json.dumps({"test1234": {"name": "Test"}}))
+
+            def _get_manager() -> Manager:
+                manager = Manager()
+                for prefix, data in json.loads(path.read_text()).items():
+                    manager.add_resource(Resource(prefix=prefix, **data))
+                return manager
+
+            reloader = ManagerReloader(
+                factory=_get_manager,
+                paths=[path],
+                callback=lambda manager: set_manager(fast_api, manager),
+            )
+            self.assertFalse(reloader.has_changed())
+            self.assertTrue(reloader.reload())
+            self.assertFalse(reloader.has_changed())
+
+            # a broken file keeps the old manager around
+            path.write_text("{")
+            self.assertTrue(reloader.has_changed())
+            self.assertFalse(reloader.reload())
+            self.assertTrue(reloader.has_changed())
+
+        self.assertIs(fast_api.manager, flask_app.manager)  # type:ignore[attr-defined]
+        res = client.get("/api/registry/test1234")
+        self.assertEqual(200, res.status_code)
+        self.assertEqual("Test", res.json()["name"])
+        res = client.get("/registry/test1234")
+        self.assertEqual(200, res.status_code)
+        self.assertIn("Test", res.text)